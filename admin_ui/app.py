@@ -2,27 +2,39 @@
 Centre AI - Admin Web UI
 Elegant Apple-style black and white interface for managing the MCP server
 """
-import json
+import asyncio
+import base64
+import binascii
 import hashlib
+import hmac
 import secrets
 import os
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from pathlib import Path
 
-from fastapi import FastAPI, Request, Depends, HTTPException, Form, File, UploadFile
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, Response, StreamingResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, Request, Depends, HTTPException, Form, File, UploadFile, BackgroundTasks
+from fastapi.responses import HTMLResponse, RedirectResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
-from starlette.middleware.sessions import SessionMiddleware
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.routing import Route
 import jwt
 import bcrypt
+import orjson
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from mcp_server.config import config
-from mcp_server.database import db, vector_store, init_databases
+from admin_ui.sessions import RedisSessionMiddleware
+from admin_ui.static_files import PrecompressedStaticFiles
+from mcp_server.database import db, vector_store, init_databases, PoolTimeoutError
 from mcp_server.tools import MCPTools
 from mcp_server.oauth import OAuth2Server, ensure_claude_client_registered
 from mcp_server.oauth_routes import (
@@ -40,50 +52,235 @@ from mcp_server.oauth_routes import (
 app = FastAPI(
     title="Centre AI Admin",
     description="Admin interface for Centre AI MCP Server",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# Add session middleware
+# Add session middleware (server-side, Redis-backed)
 app.add_middleware(
-    SessionMiddleware,
-    secret_key=config.security.secret_key,
+    RedisSessionMiddleware,
+    redis_url=config.redis.url,
     session_cookie="centre_admin_session",
-    max_age=86400  # 24 hours
+    max_age=86400,  # 24 hours
+    same_site="strict",
+    https_only=config.security.session_cookie_secure,
+    public_paths=(
+        "/health", "/static/", "/configs/", "/.well-known/", "/oauth/",
+        "/sse", "/messages", "/api/conversations"
+    )
+)
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip middleware that leaves streaming and static routes untouched"""
+
+    skip_prefixes = ("/sse", "/messages", "/static")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(self.skip_prefixes):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress HTML pages and JSON API responses
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=512, compresslevel=5)
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    """Database pool exhausted: shed load instead of queueing forever"""
+    return ORJSONResponse(
+        {"detail": "Database busy, please retry"},
+        status_code=503,
+        headers={"Retry-After": "1"}
+    )
+
+
+# Static assets (precompressed at image build time)
+app.mount(
+    "/static",
+    PrecompressedStaticFiles(directory=str(Path(__file__).parent / "static"), html=True),
+    name="static"
 )
 
 # Setup templates
 templates_dir = Path(__file__).parent / "templates"
 templates_dir.mkdir(exist_ok=True)
-templates = Jinja2Templates(directory=str(templates_dir))
-
-# Tools instance
-tools = MCPTools()
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader(str(templates_dir)),
+    autoescape=select_autoescape(),
+    auto_reload=config.server.debug,
+    cache_size=400,
+    bytecode_cache=FileSystemBytecodeCache()
+))
+
+TEMPLATE_STREAM_CHUNK = 16384
+
+
+async def render_stream(name: str, context: dict):
+    """Render a template incrementally, flushing roughly 16 KiB at a time"""
+    buffer, size = [], 0
+    for piece in templates.env.get_template(name).generate(context):
+        buffer.append(piece)
+        size += len(piece)
+        if size >= TEMPLATE_STREAM_CHUNK:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+# Pages whose HTML depends only on the template, the user and a few
+# fixed values are rendered once and then served from memory
+STATIC_PAGE_CACHE_MAX = 128
+_static_page_cache = {}
+
+
+def render_static_page(request: Request, name: str, user: str, **extra) -> Response:
+    """Render a data-free page once per (template, user, extra); always fresh in debug"""
+    context = {"request": request, "user": user, **extra}
+    if config.server.debug:
+        return templates.TemplateResponse(name, context)
+    key = (name, user, tuple(sorted(extra.items())))
+    body = _static_page_cache.get(key)
+    if body is None:
+        if len(_static_page_cache) >= STATIC_PAGE_CACHE_MAX:
+            _static_page_cache.clear()
+        body = _static_page_cache[key] = templates.env.get_template(name).render(context).encode()
+    return HTMLResponse(body)
+
+# Password hashing is CPU-bound; keep it off the event loop
+password_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Logins allowed in flight (running or queued on the executor) before
+# new attempts are turned away with 503
+PASSWORD_QUEUE_LIMIT = 64
+password_slots = asyncio.Semaphore(PASSWORD_QUEUE_LIMIT)
+
+# Argon2id for admin passwords (64 MiB, 2 iterations)
+password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
 
 
 # ==================== AUTHENTICATION ====================
 
+# Hot-path SQL is registered with the pool and prepared once per connection
+ADMIN_EXISTS_SQL = "SELECT id FROM admins WHERE username = $1"
+LOGIN_SQL = "SELECT password_hash FROM admins WHERE username = $1"
+
+db.register_statements({"admin_exists": ADMIN_EXISTS_SQL, "login": LOGIN_SQL})
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with Argon2id"""
+    return password_hasher.hash(password)
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """Verify a password against an Argon2id or legacy bcrypt hash"""
+    if password_hash.startswith("$2"):
+        return bcrypt.checkpw(password.encode(), password_hash.encode())
+    try:
+        return password_hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def verify_and_rehash(password: str, password_hash: str) -> tuple:
+    """
+    Verify a password and, when it matches a legacy bcrypt or outdated
+    Argon2 hash, return a fresh hash to store: (valid, new_hash or None)
+    """
+    if not verify_password(password, password_hash):
+        return False, None
+    if password_hash.startswith("$2") or password_hasher.check_needs_rehash(password_hash):
+        return True, hash_password(password)
+    return True, None
+
+
 def create_token(username: str) -> str:
     """Create JWT token"""
+    now = int(time.time())
     payload = {
         "sub": username,
-        "exp": datetime.utcnow() + timedelta(hours=config.security.jwt_expiry_hours),
-        "iat": datetime.utcnow()
+        "exp": now + config.security.jwt_expiry_hours * 3600,
+        "iat": now
     }
     return jwt.encode(payload, config.security.secret_key, algorithm="HS256")
 
 
+# Verified tokens: blake2b(token) -> (username, exp); bounded LRU, expiry
+# checked on hit and swept periodically
+_JWT_CACHE: "OrderedDict[bytes, tuple]" = OrderedDict()
+_JWT_CACHE_MAX = 10000
+JWT_CACHE_SWEEP_INTERVAL = 600
+
+
+def _token_key(token: str) -> bytes:
+    """Fixed-size cache key, so cache memory does not scale with token length"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+_JWT_KEY = config.security.secret_key.encode()
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _verify_hs256(token: str) -> Optional[dict]:
+    """
+    Verify an HS256 JWT signed by create_token and return its claims.
+
+    Only this app issues admin tokens, always HS256 with _JWT_KEY, so a
+    valid signature already vouches for the header; it is not parsed.
+    """
+    try:
+        signing_input, signature = token.rsplit(".", 1)
+        if signing_input.count(".") != 1:
+            return None
+        expected = hmac.new(_JWT_KEY, signing_input.encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, _b64url_decode(signature)):
+            return None
+        return orjson.loads(_b64url_decode(signing_input.split(".", 1)[1]))
+    except (ValueError, binascii.Error):
+        return None
+
+
 def verify_token(token: str) -> Optional[str]:
     """Verify JWT token and return username"""
-    try:
-        payload = jwt.decode(token, config.security.secret_key, algorithms=["HS256"])
-        return payload.get("sub")
-    except jwt.ExpiredSignatureError:
+    now = time.time()
+    key = _token_key(token)
+    hit = _JWT_CACHE.get(key)
+    if hit is not None:
+        if hit[1] > now:
+            _JWT_CACHE.move_to_end(key)
+            return hit[0]
+        del _JWT_CACHE[key]
         return None
-    except jwt.InvalidTokenError:
+
+    payload = _verify_hs256(token)
+    if not isinstance(payload, dict):
         return None
+    username, exp = payload.get("sub"), payload.get("exp")
+    if not isinstance(exp, (int, float)) or exp <= now:
+        return None
+
+    _JWT_CACHE[key] = (username, exp)
+    if len(_JWT_CACHE) > _JWT_CACHE_MAX:
+        _JWT_CACHE.popitem(last=False)
+    return username
 
 
-async def get_current_user(request: Request) -> Optional[str]:
+async def sweep_jwt_cache():
+    """Periodically drop expired tokens that are never looked up again"""
+    while True:
+        await asyncio.sleep(JWT_CACHE_SWEEP_INTERVAL)
+        now = time.time()
+        for key in [k for k, (_, exp) in _JWT_CACHE.items() if exp <= now]:
+            del _JWT_CACHE[key]
+
+
+def get_current_user(request: Request) -> Optional[str]:
     """Get current user from session"""
     token = request.session.get("token")
     if token:
@@ -93,37 +290,90 @@ async def get_current_user(request: Request) -> Optional[str]:
 
 async def require_auth(request: Request):
     """Require authentication"""
-    user = await get_current_user(request)
+    user = get_current_user(request)
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     return user
 
 
+async def get_tools(request: Request) -> MCPTools:
+    """MCP tools instance created at startup"""
+    return request.app.state.tools
+
+
+async def read_json(request: Request):
+    """Parse a JSON request body with orjson"""
+    return orjson.loads(await request.body())
+
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_background_tasks = set()
+
+
+def spawn(coro):
+    """Run a coroutine in the background without awaiting it"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def split_list_field(value: str) -> list:
+    """Parse a list form field: a JSON array or a comma-separated string"""
+    if value.lstrip().startswith("["):
+        try:
+            items = orjson.loads(value)
+        except orjson.JSONDecodeError:
+            items = None
+        if isinstance(items, list):
+            return [str(item) for item in items if item]
+    return [item for item in map(str.strip, value.split(",")) if item]
+
+
+def form_redirect(request: Request, url: str, event: str) -> Response:
+    """Answer a form POST: 303 to the list page, or 204 + HX-Trigger for htmx submits"""
+    if request.headers.get("hx-request") == "true":
+        return Response(status_code=204, headers={"HX-Trigger": event})
+    return RedirectResponse(url=url, status_code=303)
+
+
 # ==================== STARTUP ====================
 
 @app.on_event("startup")
 async def startup():
     """Initialize on startup"""
     await init_databases()
+    app.state.tools = MCPTools()
+    spawn(sweep_jwt_cache())
+
+    # Compile every template now so first page views skip the Jinja compiler
+    for template_path in templates_dir.glob("*.html"):
+        templates.env.get_template(template_path.name)
 
     # Register Claude OAuth client
     await ensure_claude_client_registered()
 
     # Create default admin if not exists
     async with db.acquire() as conn:
-        existing = await conn.fetchrow(
-            "SELECT id FROM admins WHERE username = $1",
-            config.security.admin_username
+        stmt = await db.statement(conn, "admin_exists")
+        existing = await stmt.fetchrow(config.security.admin_username)
+    if existing:
+        return
+
+    password_hash = config.security.admin_password_hash
+    if not password_hash:
+        loop = asyncio.get_running_loop()
+        password_hash = await loop.run_in_executor(
+            password_executor,
+            hash_password,
+            config.security.admin_password
         )
-        if not existing:
-            password_hash = bcrypt.hashpw(
-                config.security.admin_password.encode(),
-                bcrypt.gensalt()
-            ).decode()
-            await conn.execute("""
-                INSERT INTO admins (username, password_hash, display_name)
-                VALUES ($1, $2, $3)
-            """, config.security.admin_username, password_hash, "Administrator")
+    # Several workers may boot at once; the first insert wins
+    await db.execute("""
+        INSERT INTO admins (username, password_hash, display_name)
+        VALUES ($1, $2, $3)
+        ON CONFLICT (username) DO NOTHING
+    """, config.security.admin_username, password_hash, "Administrator")
 
 
 # ==================== ROUTES ====================
@@ -131,7 +381,7 @@ async def startup():
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """Main page - show login form directly"""
-    user = await get_current_user(request)
+    user = get_current_user(request)
     if user:
         return RedirectResponse(url="/dashboard", status_code=302)
     return await login_page(request)
@@ -147,15 +397,35 @@ async def login_page(request: Request):
 async def login(request: Request, username: str = Form(...), password: str = Form(...)):
     """Handle login"""
     async with db.acquire() as conn:
-        row = await conn.fetchrow(
-            "SELECT password_hash FROM admins WHERE username = $1",
-            username
-        )
-
-    if row and bcrypt.checkpw(password.encode(), row["password_hash"].encode()):
+        stmt = await db.statement(conn, "login")
+        row = await stmt.fetchrow(username)
+
+    valid = False
+    if row:
+        if password_slots.locked():
+            return Response(
+                "Too many login attempts in progress, please retry",
+                status_code=503,
+                headers={"Retry-After": "1"}
+            )
+        loop = asyncio.get_running_loop()
+        async with password_slots:
+            valid, new_hash = await loop.run_in_executor(
+                password_executor,
+                verify_and_rehash,
+                password,
+                row["password_hash"]
+            )
+        if new_hash:
+            await db.execute(
+                "UPDATE admins SET password_hash = $1, updated_at = CURRENT_TIMESTAMP WHERE username = $2",
+                new_hash, username
+            )
+
+    if valid:
         token = create_token(username)
         request.session["token"] = token
-        return RedirectResponse(url="/dashboard", status_code=302)
+        return RedirectResponse(url="/dashboard", status_code=303)
 
     return templates.TemplateResponse("login.html", {
         "request": request,
@@ -166,86 +436,215 @@ async def login(request: Request, username: str = Form(...), password: str = For
 @app.get("/logout")
 async def logout(request: Request):
     """Handle logout"""
+    token = request.session.get("token")
+    if token:
+        _JWT_CACHE.pop(_token_key(token), None)
     request.session.clear()
     return RedirectResponse(url="/login", status_code=302)
 
 
+# Dashboard counters: planner estimates for large tables, cached briefly
+DASHBOARD_COUNTS_TTL = 10
+EXACT_COUNT_THRESHOLD = 10000
+_dashboard_counts_cache = {"expires": 0.0, "counts": None}
+
+DASHBOARD_COUNTS_SQL = """
+    WITH est AS (
+        SELECT
+            max(reltuples) FILTER (WHERE oid = 'memories'::regclass)::bigint AS memories,
+            max(reltuples) FILTER (WHERE oid = 'codebases'::regclass)::bigint AS codebases,
+            max(reltuples) FILTER (WHERE oid = 'projects'::regclass)::bigint AS projects,
+            max(reltuples) FILTER (WHERE oid = 'instructions'::regclass)::bigint AS instructions,
+            max(reltuples) FILTER (WHERE oid = 'conversations'::regclass)::bigint AS conversations
+        FROM pg_class
+        WHERE oid IN ('memories'::regclass, 'codebases'::regclass, 'projects'::regclass,
+                      'instructions'::regclass, 'conversations'::regclass)
+    )
+    SELECT
+        CASE WHEN memories >= $1 THEN memories
+             ELSE (SELECT COUNT(*) FROM memories) END AS memories,
+        CASE WHEN codebases >= $1 THEN codebases
+             ELSE (SELECT COUNT(*) FROM codebases) END AS codebases,
+        CASE WHEN projects >= $1 THEN projects
+             ELSE (SELECT COUNT(*) FROM projects) END AS projects,
+        CASE WHEN instructions >= $1 THEN instructions
+             ELSE (SELECT COUNT(*) FROM instructions) END AS instructions,
+        CASE WHEN conversations >= $1 THEN conversations
+             ELSE (SELECT COUNT(*) FROM conversations) END AS conversations
+    FROM est
+"""
+
+
+async def fetch_dashboard_counts():
+    """Fetch dashboard row counts in a single round trip"""
+    now = time.monotonic()
+    if _dashboard_counts_cache["counts"] and _dashboard_counts_cache["expires"] > now:
+        return _dashboard_counts_cache["counts"]
+
+    # pg_class.reltuples is O(1) but only meaningful once a table has been
+    # analyzed, so small tables fall back to an exact COUNT(*)
+    async with db.acquire() as conn:
+        stmt = await db.statement(conn, "dashboard_counts")
+        row = await stmt.fetchrow(EXACT_COUNT_THRESHOLD)
+
+    counts = dict(row)
+    _dashboard_counts_cache["counts"] = counts
+    _dashboard_counts_cache["expires"] = now + DASHBOARD_COUNTS_TTL
+    return counts
+
+
 @app.get("/dashboard", response_class=HTMLResponse)
 async def dashboard(request: Request, user: str = Depends(require_auth)):
     """Main dashboard"""
     # Get statistics
-    async with db.acquire() as conn:
-        memory_count = await conn.fetchval("SELECT COUNT(*) FROM memories")
-        codebase_count = await conn.fetchval("SELECT COUNT(*) FROM codebases")
-        project_count = await conn.fetchval("SELECT COUNT(*) FROM projects")
-        instruction_count = await conn.fetchval("SELECT COUNT(*) FROM instructions")
-        conversation_count = await conn.fetchval("SELECT COUNT(*) FROM conversations")
-
-    vector_stats = await vector_store.get_stats()
+    counts, vector_stats = await asyncio.gather(
+        fetch_dashboard_counts(),
+        vector_store.get_stats()
+    )
 
     return templates.TemplateResponse("dashboard.html", {
         "request": request,
         "user": user,
         "stats": {
-            "memories": memory_count,
-            "codebases": codebase_count,
-            "projects": project_count,
-            "instructions": instruction_count,
-            "conversations": conversation_count,
+            "memories": counts["memories"],
+            "codebases": counts["codebases"],
+            "projects": counts["projects"],
+            "instructions": counts["instructions"],
+            "conversations": counts["conversations"],
             "vectors": vector_stats
         }
     })
 
 
+# Page data: short TTL cache. Each section has a version that writes bump,
+# so stale entries simply stop being addressed and age out.
+PAGE_CACHE_TTL = 5
+PAGE_CACHE_MAX = 256
+_page_cache = {}
+_page_versions = {
+    "memories": 0, "codebases": 0, "projects": 0, "instructions": 0, "knowledge_graph": 0
+}
+
+
+async def cached_page_data(section: str, key, loader, ttl: float = PAGE_CACHE_TTL):
+    """Return loader() for (section, key), reusing results for ttl seconds"""
+    now = time.monotonic()
+    cache_key = (section, _page_versions.get(section, 0), key)
+    hit = _page_cache.get(cache_key)
+    if hit and hit[0] > now:
+        return hit[1]
+
+    value = await loader()
+    if len(_page_cache) >= PAGE_CACHE_MAX:
+        for stale in [k for k, (expires, _) in _page_cache.items() if expires <= now]:
+            del _page_cache[stale]
+    _page_cache[cache_key] = (now + ttl, value)
+    return value
+
+
+def invalidate_page(section: str):
+    """Drop cached page data for a section after a write"""
+    _page_versions[section] += 1
+
+
+MEMORIES_PAGE_SIZE = 25
+
+MEMORIES_PAGE_SQL = """
+    SELECT id, left(content, 201) AS content, memory_type, importance,
+           COALESCE(tags, '{}') AS tags
+    FROM memories
+    WHERE $1::int IS NULL OR id < $1
+    ORDER BY id DESC
+    LIMIT $2
+"""
+
+DELETE_MEMORY_SQL = "DELETE FROM memories WHERE id = $1 RETURNING embedding_id"
+
+db.register_statements({
+    "memories_page": MEMORIES_PAGE_SQL,
+    "delete_memory": DELETE_MEMORY_SQL
+})
+
+
 @app.get("/memories", response_class=HTMLResponse)
-async def memories_page(request: Request, user: str = Depends(require_auth)):
-    """Memories management page"""
-    result = await tools.get_memory(limit=100, semantic_search=False)
-    return templates.TemplateResponse("memories.html", {
+async def memories_page(
+    request: Request,
+    after_id: Optional[int] = None,
+    user: str = Depends(require_auth)
+):
+    """Memories management page (keyset-paginated, newest first)"""
+    async def load():
+        async with db.acquire() as conn:
+            stmt = await db.statement(conn, "memories_page")
+            return await stmt.fetch(after_id, MEMORIES_PAGE_SIZE)
+
+    memories = await cached_page_data("memories", after_id, load)
+    next_after_id = memories[-1]["id"] if len(memories) == MEMORIES_PAGE_SIZE else None
+    return StreamingResponse(render_stream("memories.html", {
         "request": request,
         "user": user,
-        "memories": result.get("memories", [])
-    })
+        "memories": memories,
+        "after_id": after_id,
+        "next_after_id": next_after_id
+    }), media_type="text/html")
 
 
 @app.post("/memories")
 async def create_memory(
     request: Request,
+    background_tasks: BackgroundTasks,
     user: str = Depends(require_auth),
+    tools: MCPTools = Depends(get_tools),
     content: str = Form(...),
     memory_type: str = Form("general"),
     importance: int = Form(5),
     tags: str = Form("")
 ):
-    """Create new memory"""
-    tag_list = [t.strip() for t in tags.split(",") if t.strip()]
-    await tools.create_memory(
+    """Create new memory (embedding runs after the redirect is sent)"""
+    tag_list = split_list_field(tags)
+    background_tasks.add_task(
+        tools.create_memory,
         content=content,
         memory_type=memory_type,
         importance=importance,
         tags=tag_list
     )
-    return RedirectResponse(url="/memories", status_code=302)
+    background_tasks.add_task(invalidate_page, "memories")
+    return form_redirect(request, "/memories", "memoriesChanged")
 
 
 @app.delete("/memories/{memory_id}")
 async def delete_memory(memory_id: int, user: str = Depends(require_auth)):
     """Delete memory"""
     async with db.acquire() as conn:
-        row = await conn.fetchrow(
-            "SELECT embedding_id FROM memories WHERE id = $1",
-            memory_id
-        )
-        if row and row["embedding_id"]:
-            await vector_store.delete(vector_store.COLLECTION_MEMORIES, row["embedding_id"])
-        await conn.execute("DELETE FROM memories WHERE id = $1", memory_id)
-    return JSONResponse({"success": True})
+        stmt = await db.statement(conn, "delete_memory")
+        row = await stmt.fetchrow(memory_id)
+    invalidate_page("memories")
+    if row and row["embedding_id"]:
+        spawn(vector_store.delete(vector_store.COLLECTION_MEMORIES, row["embedding_id"]))
+    return ORJSONResponse({"success": True})
+
+
+@app.post("/memories/bulk-delete")
+async def bulk_delete_memories(request: Request, user: str = Depends(require_auth)):
+    """Delete several memories in one statement"""
+    ids = [int(i) for i in (await read_json(request))["ids"]]
+    rows = await db.fetch(
+        "DELETE FROM memories WHERE id = ANY($1::int[]) RETURNING embedding_id",
+        ids
+    )
+    invalidate_page("memories")
+    spawn(vector_store.delete_many(
+        vector_store.COLLECTION_MEMORIES,
+        [r["embedding_id"] for r in rows if r["embedding_id"]]
+    ))
+    return ORJSONResponse({"success": True, "deleted": len(rows)})
 
 
 @app.get("/codebases", response_class=HTMLResponse)
-async def codebases_page(request: Request, user: str = Depends(require_auth)):
+async def codebases_page(request: Request, user: str = Depends(require_auth), tools: MCPTools = Depends(get_tools)):
     """Codebases management page"""
-    result = await tools.get_codebase(limit=50)
+    result = await cached_page_data("codebases", None, lambda: tools.get_codebase(limit=50))
     return templates.TemplateResponse("codebases.html", {
         "request": request,
         "user": user,
@@ -256,26 +655,30 @@ async def codebases_page(request: Request, user: str = Depends(require_auth)):
 @app.post("/codebases")
 async def create_codebase(
     request: Request,
+    background_tasks: BackgroundTasks,
     user: str = Depends(require_auth),
+    tools: MCPTools = Depends(get_tools),
     name: str = Form(...),
     path: str = Form(...),
     description: str = Form(""),
     repo_url: str = Form("")
 ):
-    """Index new codebase"""
-    result = await tools.capture_codebase(
+    """Index new codebase (indexing runs after the redirect is sent)"""
+    background_tasks.add_task(
+        tools.capture_codebase,
         name=name,
         path=path,
         description=description or None,
         repo_url=repo_url or None
     )
-    return RedirectResponse(url="/codebases", status_code=302)
+    background_tasks.add_task(invalidate_page, "codebases")
+    return form_redirect(request, "/codebases", "codebasesChanged")
 
 
 @app.get("/projects", response_class=HTMLResponse)
-async def projects_page(request: Request, user: str = Depends(require_auth)):
+async def projects_page(request: Request, user: str = Depends(require_auth), tools: MCPTools = Depends(get_tools)):
     """Projects management page"""
-    result = await tools.project_overview()
+    result = await cached_page_data("projects", None, tools.project_overview)
     return templates.TemplateResponse("projects.html", {
         "request": request,
         "user": user,
@@ -294,19 +697,19 @@ async def create_project(
     tags: str = Form("")
 ):
     """Create new project"""
-    tag_list = [t.strip() for t in tags.split(",") if t.strip()]
-    async with db.acquire() as conn:
-        await conn.execute("""
-            INSERT INTO projects (name, description, status, priority, tags)
-            VALUES ($1, $2, $3, $4, $5)
-        """, name, description, status, priority, tag_list)
-    return RedirectResponse(url="/projects", status_code=302)
+    tag_list = split_list_field(tags)
+    await db.execute("""
+        INSERT INTO projects (name, description, status, priority, tags)
+        VALUES ($1, $2, $3, $4, $5)
+    """, name, description, status, priority, tag_list)
+    invalidate_page("projects")
+    return form_redirect(request, "/projects", "projectsChanged")
 
 
 @app.get("/instructions", response_class=HTMLResponse)
-async def instructions_page(request: Request, user: str = Depends(require_auth)):
+async def instructions_page(request: Request, user: str = Depends(require_auth), tools: MCPTools = Depends(get_tools)):
     """Instructions management page"""
-    result = await tools.get_instructions(active_only=False)
+    result = await cached_page_data("instructions", None, lambda: tools.get_instructions(active_only=False))
     return templates.TemplateResponse("instructions.html", {
         "request": request,
         "user": user,
@@ -324,16 +727,16 @@ async def create_instruction(
     priority: int = Form(5)
 ):
     """Create new instruction"""
-    async with db.acquire() as conn:
-        await conn.execute("""
-            INSERT INTO instructions (title, content, category, priority)
-            VALUES ($1, $2, $3, $4)
-        """, title, content, category or None, priority)
-    return RedirectResponse(url="/instructions", status_code=302)
+    await db.execute("""
+        INSERT INTO instructions (title, content, category, priority)
+        VALUES ($1, $2, $3, $4)
+    """, title, content, category or None, priority)
+    invalidate_page("instructions")
+    return form_redirect(request, "/instructions", "instructionsChanged")
 
 
 @app.get("/admins", response_class=HTMLResponse)
-async def admins_page(request: Request, user: str = Depends(require_auth)):
+async def admins_page(request: Request, user: str = Depends(require_auth), tools: MCPTools = Depends(get_tools)):
     """Admin profiles management page"""
     result = await tools.who_am_i_talking_to()
     return templates.TemplateResponse("admins.html", {
@@ -355,8 +758,8 @@ async def update_admin(
     expertise: str = Form("")
 ):
     """Update admin profile"""
-    languages_list = [l.strip() for l in languages.split(",") if l.strip()]
-    expertise_list = [e.strip() for e in expertise.split(",") if e.strip()]
+    languages_list = split_list_field(languages)
+    expertise_list = split_list_field(expertise)
 
     metadata = {
         "timezone": timezone,
@@ -364,18 +767,17 @@ async def update_admin(
         "expertise": expertise_list
     }
 
-    async with db.acquire() as conn:
-        await conn.execute("""
-            UPDATE admins SET
-                display_name = $1,
-                email = $2,
-                bio = $3,
-                metadata = $4,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE username = $5
-        """, display_name, email, bio, json.dumps(metadata), user)
+    await db.execute("""
+        UPDATE admins SET
+            display_name = $1,
+            email = $2,
+            bio = $3,
+            metadata = $4,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE username = $5
+    """, display_name, email, bio, metadata, user)
 
-    return RedirectResponse(url="/admins", status_code=302)
+    return form_redirect(request, "/admins", "adminsChanged")
 
 
 @app.get("/knowledge", response_class=HTMLResponse)
@@ -387,11 +789,45 @@ async def knowledge_page(request: Request, user: str = Depends(require_auth)):
     })
 
 
-@app.get("/api/knowledge-graph")
-async def get_knowledge_graph(user: str = Depends(require_auth)):
-    """API endpoint for knowledge graph data"""
+# Nodes and edges are insert/delete only, so counts plus the newest
+# id/timestamp change whenever the graph does
+KNOWLEDGE_GRAPH_VERSION_SQL = """
+    SELECT concat_ws('-',
+        (SELECT concat_ws('-', count(*), max(id), max(created_at)) FROM knowledge_nodes),
+        (SELECT concat_ws('-', count(*), max(id), max(created_at)) FROM knowledge_edges))
+"""
+
+db.register_statements({"knowledge_graph_version": KNOWLEDGE_GRAPH_VERSION_SQL})
+
+# The graph only changes on sync and node/edge writes, which invalidate it
+KNOWLEDGE_GRAPH_CACHE_TTL = 30
+
+
+async def load_knowledge_graph(tools: MCPTools):
+    """Fetch the graph and its ETag, serialized once per cache period"""
+    async with db.acquire() as conn:
+        stmt = await db.statement(conn, "knowledge_graph_version")
+        version = await stmt.fetchval()
+    etag = 'W/"%s"' % hashlib.md5(version.encode()).hexdigest()
     result = await tools.get_knowledge_graph(limit=200)
-    return JSONResponse(result)
+    return etag, orjson.dumps(result)
+
+
+@app.get("/api/knowledge-graph")
+async def get_knowledge_graph(
+    request: Request,
+    user: str = Depends(require_auth),
+    tools: MCPTools = Depends(get_tools)
+):
+    """API endpoint for knowledge graph data (conditional GET via weak ETag)"""
+    etag, body = await cached_page_data(
+        "knowledge_graph", None, lambda: load_knowledge_graph(tools),
+        ttl=KNOWLEDGE_GRAPH_CACHE_TTL
+    )
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={KNOWLEDGE_GRAPH_CACHE_TTL}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 
 @app.post("/api/knowledge-node")
@@ -400,14 +836,14 @@ async def create_knowledge_node(
     user: str = Depends(require_auth)
 ):
     """Create knowledge node"""
-    data = await request.json()
-    async with db.acquire() as conn:
-        row = await conn.fetchrow("""
-            INSERT INTO knowledge_nodes (node_type, title, content, parent_id)
-            VALUES ($1, $2, $3, $4)
-            RETURNING id
-        """, data.get("type", "concept"), data["title"], data.get("content"), data.get("parent_id"))
-    return JSONResponse({"success": True, "id": row["id"]})
+    data = await read_json(request)
+    row = await db.fetchrow("""
+        INSERT INTO knowledge_nodes (node_type, title, content, parent_id)
+        VALUES ($1, $2, $3, $4)
+        RETURNING id
+    """, data.get("type", "concept"), data["title"], data.get("content"), data.get("parent_id"))
+    invalidate_page("knowledge_graph")
+    return ORJSONResponse({"success": True, "id": row["id"]})
 
 
 @app.post("/api/knowledge-edge")
@@ -416,14 +852,191 @@ async def create_knowledge_edge(
     user: str = Depends(require_auth)
 ):
     """Create knowledge edge"""
-    data = await request.json()
+    data = await read_json(request)
+    row = await db.fetchrow("""
+        INSERT INTO knowledge_edges (source_id, target_id, relationship, weight)
+        VALUES ($1, $2, $3, $4)
+        RETURNING id
+    """, data["source"], data["target"], data["relationship"], data.get("weight", 1.0))
+    invalidate_page("knowledge_graph")
+    return ORJSONResponse({"success": True, "id": row["id"]})
+
+
+@app.post("/api/knowledge-nodes/bulk")
+async def create_knowledge_nodes_bulk(
+    request: Request,
+    user: str = Depends(require_auth)
+):
+    """Create many knowledge nodes in a single statement"""
+    nodes = (await read_json(request))["nodes"]
+    rows = await db.fetch("""
+        INSERT INTO knowledge_nodes (node_type, title, content, parent_id)
+        SELECT node_type, title, content, parent_id
+        FROM unnest($1::varchar[], $2::varchar[], $3::text[], $4::int[])
+            WITH ORDINALITY AS n(node_type, title, content, parent_id, ord)
+        ORDER BY ord
+        RETURNING id
+    """,
+        [n.get("type", "concept") for n in nodes],
+        [n["title"] for n in nodes],
+        [n.get("content") for n in nodes],
+        [n.get("parent_id") for n in nodes])
+    invalidate_page("knowledge_graph")
+    return ORJSONResponse({"success": True, "ids": [r["id"] for r in rows]})
+
+
+@app.post("/api/knowledge-edges/bulk")
+async def create_knowledge_edges_bulk(
+    request: Request,
+    user: str = Depends(require_auth)
+):
+    """Create many knowledge edges in a single statement"""
+    edges = (await read_json(request))["edges"]
+    rows = await db.fetch("""
+        INSERT INTO knowledge_edges (source_id, target_id, relationship, weight)
+        SELECT source_id, target_id, relationship, weight
+        FROM unnest($1::int[], $2::int[], $3::varchar[], $4::float8[])
+            WITH ORDINALITY AS e(source_id, target_id, relationship, weight, ord)
+        ORDER BY ord
+        RETURNING id
+    """,
+        [e["source"] for e in edges],
+        [e["target"] for e in edges],
+        [e["relationship"] for e in edges],
+        [e.get("weight", 1.0) for e in edges])
+    invalidate_page("knowledge_graph")
+    return ORJSONResponse({"success": True, "ids": [r["id"] for r in rows]})
+
+
+# Knowledge graph sync: one set-based statement per entity type
+KNOWLEDGE_SYNC_LOCK_ID = 0x6B6773796E63  # arbitrary app-wide advisory lock key base
+
+SYNC_MEMORY_NODES_SQL = """
+    WITH new_memories AS (
+        INSERT INTO knowledge_nodes (node_type, title, content)
+        SELECT DISTINCT ON (m.title) 'memory', m.title, m.content
+        FROM (
+            SELECT CASE WHEN length(content) > 50 THEN left(content, 50) || '...'
+                        ELSE content END AS title,
+                   content
+            FROM memories
+            ORDER BY importance DESC, created_at DESC
+            LIMIT 50
+        ) m
+        WHERE NOT EXISTS (
+            SELECT 1 FROM knowledge_nodes kn
+            WHERE kn.node_type = 'memory' AND kn.title = m.title
+        )
+        RETURNING id
+    )
+    SELECT count(*) FROM new_memories
+"""
+
+SYNC_CODEBASE_NODES_SQL = """
+    WITH new_codebases AS (
+        INSERT INTO knowledge_nodes (node_type, title, content)
+        SELECT DISTINCT ON (c.name) 'technology', c.name,
+               format('%s | Language: %s | Files: %s',
+                      COALESCE(NULLIF(c.description, ''), 'No description'),
+                      COALESCE(NULLIF(c.language, ''), 'Mixed'),
+                      COALESCE(c.file_count, 0))
+        FROM codebases c
+        WHERE NOT EXISTS (
+            SELECT 1 FROM knowledge_nodes kn
+            WHERE kn.node_type = 'technology' AND kn.title = c.name
+        )
+        ORDER BY c.name, c.indexed_at DESC
+        RETURNING id, title
+    ),
+    languages AS (
+        SELECT DISTINCT nc.id AS node_id, initcap(l.language) AS title, l.language
+        FROM new_codebases nc
+        JOIN codebases c ON c.name = nc.title
+        CROSS JOIN LATERAL (
+            SELECT DISTINCT language FROM code_files
+            WHERE codebase_id = c.id AND language IS NOT NULL
+            LIMIT 5
+        ) l
+    ),
+    new_languages AS (
+        INSERT INTO knowledge_nodes (node_type, title, content)
+        SELECT DISTINCT ON (title) 'technology', title, 'Programming language: ' || language
+        FROM languages
+        WHERE NOT EXISTS (
+            SELECT 1 FROM knowledge_nodes kn
+            WHERE kn.node_type = 'technology' AND kn.title = languages.title
+        )
+        RETURNING id, title
+    ),
+    language_nodes AS (
+        SELECT id, title FROM new_languages
+        UNION ALL
+        (SELECT DISTINCT ON (title) id, title FROM knowledge_nodes
+         WHERE node_type = 'technology' AND title IN (SELECT title FROM languages)
+         ORDER BY title, id)
+    ),
+    new_edges AS (
+        INSERT INTO knowledge_edges (source_id, target_id, relationship, weight)
+        SELECT DISTINCT languages.node_id, ln.id, 'uses_language', 1.0
+        FROM languages
+        JOIN language_nodes ln ON ln.title = languages.title
+        RETURNING id
+    )
+    SELECT (SELECT count(*) FROM new_codebases) + (SELECT count(*) FROM new_languages) AS nodes,
+           (SELECT count(*) FROM new_edges) AS edges
+"""
+
+SYNC_PROJECT_NODES_SQL = """
+    WITH new_projects AS (
+        INSERT INTO knowledge_nodes (node_type, title, content)
+        SELECT DISTINCT ON (p.name) 'project', p.name,
+               format('%s | Status: %s | Priority: %s',
+                      COALESCE(NULLIF(p.description, ''), 'No description'),
+                      p.status, p.priority)
+        FROM projects p
+        WHERE NOT EXISTS (
+            SELECT 1 FROM knowledge_nodes kn
+            WHERE kn.node_type = 'project' AND kn.title = p.name
+        )
+        ORDER BY p.name, p.priority DESC, p.updated_at DESC
+        RETURNING id, title
+    ),
+    related AS (
+        SELECT DISTINCT np.id AS source_id, r.id AS target_id
+        FROM new_projects np
+        JOIN projects p ON p.name = np.title
+        CROSS JOIN LATERAL unnest(p.tags) AS tag
+        CROSS JOIN LATERAL (
+            SELECT kn.id FROM knowledge_nodes kn
+            WHERE kn.node_type = 'technology'
+              AND (kn.title ILIKE '%' || tag || '%' OR kn.content ILIKE '%' || tag || '%')
+            LIMIT 3
+        ) r
+    ),
+    new_edges AS (
+        INSERT INTO knowledge_edges (source_id, target_id, relationship, weight)
+        SELECT source_id, target_id, 'relates_to', 0.7 FROM related
+        RETURNING id
+    )
+    SELECT (SELECT count(*) FROM new_projects) AS nodes,
+           (SELECT count(*) FROM new_edges) AS edges
+"""
+
+db.register_statements({
+    "sync_memory_nodes": SYNC_MEMORY_NODES_SQL,
+    "sync_codebase_nodes": SYNC_CODEBASE_NODES_SQL,
+    "sync_project_nodes": SYNC_PROJECT_NODES_SQL
+})
+
+
+async def run_sync_statement(name: str, lock_offset: int, method: str):
+    """Run one sync statement in its own transaction, serialized per entity type"""
     async with db.acquire() as conn:
-        row = await conn.fetchrow("""
-            INSERT INTO knowledge_edges (source_id, target_id, relationship, weight)
-            VALUES ($1, $2, $3, $4)
-            RETURNING id
-        """, data["source"], data["target"], data["relationship"], data.get("weight", 1.0))
-    return JSONResponse({"success": True, "id": row["id"]})
+        async with conn.transaction():
+            # Concurrent syncs of the same node type cannot race their NOT EXISTS checks
+            await conn.execute("SELECT pg_advisory_xact_lock($1)", KNOWLEDGE_SYNC_LOCK_ID + lock_offset)
+            stmt = await db.statement(conn, name)
+            return await getattr(stmt, method)()
 
 
 @app.post("/api/knowledge-graph/sync")
@@ -432,137 +1045,19 @@ async def sync_knowledge_graph(user: str = Depends(require_auth)):
     Automatically sync knowledge graph with memories, codebases, and projects.
     Creates nodes and edges based on existing data.
     """
-    nodes_created = 0
-    edges_created = 0
+    # Memories and codebases are independent; projects link to the
+    # technology nodes the codebase phase creates, so they run afterwards
+    memory_nodes, codebase_counts = await asyncio.gather(
+        run_sync_statement("sync_memory_nodes", 0, "fetchval"),
+        run_sync_statement("sync_codebase_nodes", 1, "fetchrow")
+    )
+    project_counts = await run_sync_statement("sync_project_nodes", 2, "fetchrow")
+    invalidate_page("knowledge_graph")
 
-    async with db.acquire() as conn:
-        # Sync memories as nodes
-        memories = await conn.fetch("""
-            SELECT id, content, memory_type, importance, tags
-            FROM memories
-            ORDER BY importance DESC, created_at DESC
-            LIMIT 50
-        """)
-
-        for memory in memories:
-            # Check if node already exists
-            existing = await conn.fetchrow("""
-                SELECT id FROM knowledge_nodes
-                WHERE node_type = 'memory' AND title = $1
-            """, f"Memory #{memory['id']}")
-
-            if not existing:
-                title = memory['content'][:50] + "..." if len(memory['content']) > 50 else memory['content']
-                await conn.execute("""
-                    INSERT INTO knowledge_nodes (node_type, title, content, parent_id)
-                    VALUES ($1, $2, $3, $4)
-                """, 'memory', title, memory['content'], None)
-                nodes_created += 1
-
-        # Sync codebases as nodes
-        codebases = await conn.fetch("""
-            SELECT id, name, description, language, file_count
-            FROM codebases
-            ORDER BY indexed_at DESC
-        """)
-
-        for codebase in codebases:
-            existing = await conn.fetchrow("""
-                SELECT id FROM knowledge_nodes
-                WHERE node_type = 'codebase' AND title = $1
-            """, codebase['name'])
-
-            if not existing:
-                content = f"{codebase['description'] or 'No description'} | Language: {codebase['language'] or 'Mixed'} | Files: {codebase['file_count'] or 0}"
-                node_row = await conn.fetchrow("""
-                    INSERT INTO knowledge_nodes (node_type, title, content, parent_id)
-                    VALUES ($1, $2, $3, $4)
-                    RETURNING id
-                """, 'technology', codebase['name'], content, None)
-                nodes_created += 1
-
-                # Create edges to related code files (most important ones)
-                code_files = await conn.fetch("""
-                    SELECT DISTINCT language FROM code_files
-                    WHERE codebase_id = $1
-                    LIMIT 5
-                """, codebase['id'])
-
-                for file in code_files:
-                    # Find or create language node
-                    lang_node = await conn.fetchrow("""
-                        SELECT id FROM knowledge_nodes
-                        WHERE node_type = 'technology' AND title = $1
-                    """, file['language'].title())
-
-                    if not lang_node:
-                        lang_node = await conn.fetchrow("""
-                            INSERT INTO knowledge_nodes (node_type, title, content, parent_id)
-                            VALUES ($1, $2, $3, $4)
-                            RETURNING id
-                        """, 'technology', file['language'].title(), f"Programming language: {file['language']}", None)
-                        nodes_created += 1
-
-                    # Create edge between codebase and language
-                    edge_exists = await conn.fetchrow("""
-                        SELECT id FROM knowledge_edges
-                        WHERE source_id = $1 AND target_id = $2
-                    """, node_row['id'], lang_node['id'])
-
-                    if not edge_exists:
-                        await conn.execute("""
-                            INSERT INTO knowledge_edges (source_id, target_id, relationship, weight)
-                            VALUES ($1, $2, $3, $4)
-                        """, node_row['id'], lang_node['id'], 'uses_language', 1.0)
-                        edges_created += 1
-
-        # Sync projects as nodes
-        projects = await conn.fetch("""
-            SELECT id, name, description, status, priority, tags
-            FROM projects
-            ORDER BY priority DESC, updated_at DESC
-        """)
-
-        for project in projects:
-            existing = await conn.fetchrow("""
-                SELECT id FROM knowledge_nodes
-                WHERE node_type = 'project' AND title = $1
-            """, project['name'])
-
-            if not existing:
-                content = f"{project['description'] or 'No description'} | Status: {project['status']} | Priority: {project['priority']}"
-                project_node = await conn.fetchrow("""
-                    INSERT INTO knowledge_nodes (node_type, title, content, parent_id)
-                    VALUES ($1, $2, $3, $4)
-                    RETURNING id
-                """, 'project', project['name'], content, None)
-                nodes_created += 1
-
-                # Create edges based on tags
-                if project['tags']:
-                    for tag in project['tags']:
-                        # Find related codebases with similar names or descriptions
-                        related_codebases = await conn.fetch("""
-                            SELECT kn.id FROM knowledge_nodes kn
-                            WHERE kn.node_type = 'technology'
-                            AND (kn.title ILIKE $1 OR kn.content ILIKE $1)
-                            LIMIT 3
-                        """, f"%{tag}%")
-
-                        for cb in related_codebases:
-                            edge_exists = await conn.fetchrow("""
-                                SELECT id FROM knowledge_edges
-                                WHERE source_id = $1 AND target_id = $2
-                            """, project_node['id'], cb['id'])
-
-                            if not edge_exists:
-                                await conn.execute("""
-                                    INSERT INTO knowledge_edges (source_id, target_id, relationship, weight)
-                                    VALUES ($1, $2, $3, $4)
-                                """, project_node['id'], cb['id'], 'relates_to', 0.7)
-                                edges_created += 1
-
-    return JSONResponse({
+    nodes_created = memory_nodes + codebase_counts["nodes"] + project_counts["nodes"]
+    edges_created = codebase_counts["edges"] + project_counts["edges"]
+
+    return ORJSONResponse({
         "success": True,
         "nodes_created": nodes_created,
         "edges_created": edges_created,
@@ -571,9 +1066,9 @@ async def sync_knowledge_graph(user: str = Depends(require_auth)):
 
 
 @app.get("/conversations", response_class=HTMLResponse)
-async def conversations_page(request: Request, user: str = Depends(require_auth)):
+async def conversations_page(request: Request, user: str = Depends(require_auth), tools: MCPTools = Depends(get_tools)):
     """Conversations view page"""
-    result = await tools.conversation_overview(limit=50)
+    result = await cached_page_data("conversations", None, lambda: tools.conversation_overview(limit=50))
     return templates.TemplateResponse("conversations.html", {
         "request": request,
         "user": user,
@@ -584,18 +1079,17 @@ async def conversations_page(request: Request, user: str = Depends(require_auth)
 @app.get("/oauth-clients", response_class=HTMLResponse)
 async def oauth_clients_page(request: Request, user: str = Depends(require_auth)):
     """OAuth clients management page"""
-    async with db.acquire() as conn:
-        clients = await conn.fetch("""
-            SELECT id, client_id, client_name, redirect_uris, is_public, is_active,
-                   created_at::text as created_at
-            FROM oauth_clients
-            ORDER BY created_at DESC
-        """)
+    clients = await db.fetch("""
+        SELECT id, client_id, client_name, redirect_uris, is_public, is_active,
+               created_at::text as created_at
+        FROM oauth_clients
+        ORDER BY created_at DESC
+    """)
 
     return templates.TemplateResponse("oauth_clients.html", {
         "request": request,
         "user": user,
-        "clients": [dict(c) for c in clients],
+        "clients": clients,
         "mcp_port": config.server.mcp_port
     })
 
@@ -606,14 +1100,14 @@ async def create_oauth_client(
     user: str = Depends(require_auth)
 ):
     """Create new OAuth client"""
-    data = await request.json()
+    data = await read_json(request)
 
     client_name = data.get("client_name")
     redirect_uris = data.get("redirect_uris", [])
     is_public = data.get("is_public", True)
 
     if not client_name or not redirect_uris:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "error": "client_name and redirect_uris are required"
         })
@@ -625,12 +1119,12 @@ async def create_oauth_client(
             is_public=is_public
         )
 
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "client": client
         })
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "error": str(e)
         })
@@ -643,41 +1137,61 @@ async def update_oauth_client(
     user: str = Depends(require_auth)
 ):
     """Update OAuth client"""
-    data = await request.json()
+    data = await read_json(request)
     is_active = data.get("is_active")
 
-    async with db.acquire() as conn:
-        await conn.execute("""
-            UPDATE oauth_clients SET is_active = $1, updated_at = CURRENT_TIMESTAMP
-            WHERE id = $2
-        """, is_active, client_id)
+    await db.execute("""
+        UPDATE oauth_clients SET is_active = $1, updated_at = CURRENT_TIMESTAMP
+        WHERE id = $2
+    """, is_active, client_id)
+
+    return ORJSONResponse({"success": True})
 
-    return JSONResponse({"success": True})
+
+SEARCH_SETTINGS_SQL = """
+    SELECT setting_key, setting_value FROM system_settings
+    WHERE setting_key = ANY($1::text[])
+"""
+
+SAVE_SEARCH_SETTINGS_SQL = """
+    INSERT INTO system_settings (setting_key, setting_value, setting_type, description)
+    SELECT * FROM unnest($1::text[], $2::text[], $3::text[], $4::text[])
+    ON CONFLICT (setting_key) DO UPDATE
+    SET setting_value = EXCLUDED.setting_value, updated_at = CURRENT_TIMESTAMP
+"""
+
+SEARCH_SETTING_KEYS = ["search_engine", "searx_instance_url", "search_results_count"]
+
+db.register_statements({
+    "search_settings": SEARCH_SETTINGS_SQL,
+    "save_search_settings": SAVE_SEARCH_SETTINGS_SQL
+})
+
+
+async def load_search_settings() -> dict:
+    """Load the search engine settings in one query, with defaults"""
+    async with db.acquire() as conn:
+        stmt = await db.statement(conn, "search_settings")
+        rows = await stmt.fetch(SEARCH_SETTING_KEYS)
+    values = {r["setting_key"]: r["setting_value"] for r in rows}
+    return {
+        "search_engine": values.get("search_engine", "duckduckgo"),
+        "searx_instance_url": values.get("searx_instance_url", "https://searx.be"),
+        "search_results_count": int(values.get("search_results_count", 10))
+    }
 
 
 @app.get("/settings", response_class=HTMLResponse)
 async def settings_page(request: Request, user: str = Depends(require_auth)):
     """Settings page"""
-    # Load search engine settings
-    async with db.acquire() as conn:
-        search_engine_row = await conn.fetchrow(
-            "SELECT setting_value FROM system_settings WHERE setting_key = 'search_engine'"
-        )
-        searx_url_row = await conn.fetchrow(
-            "SELECT setting_value FROM system_settings WHERE setting_key = 'searx_instance_url'"
-        )
-        results_count_row = await conn.fetchrow(
-            "SELECT setting_value FROM system_settings WHERE setting_key = 'search_results_count'"
-        )
+    search_settings = await load_search_settings()
 
     return templates.TemplateResponse("settings.html", {
         "request": request,
         "user": user,
         "mcp_token": config.security.mcp_auth_token,
         "mcp_port": config.server.mcp_port,
-        "search_engine": search_engine_row["setting_value"] if search_engine_row else "duckduckgo",
-        "searx_instance_url": searx_url_row["setting_value"] if searx_url_row else "https://searx.be",
-        "search_results_count": int(results_count_row["setting_value"]) if results_count_row else 10
+        **search_settings
     })
 
 
@@ -686,7 +1200,7 @@ async def regenerate_token(user: str = Depends(require_auth)):
     """Regenerate MCP auth token"""
     # Note: In production, this would update the config and restart the MCP server
     new_token = secrets.token_hex(32)
-    return JSONResponse({"token": new_token})
+    return ORJSONResponse({"token": new_token})
 
 
 @app.post("/api/settings/search")
@@ -695,7 +1209,7 @@ async def save_search_settings(
     user: str = Depends(require_auth)
 ):
     """Save search engine settings"""
-    data = await request.json()
+    data = await read_json(request)
 
     search_engine = data.get("search_engine", "duckduckgo")
     searx_url = data.get("searx_instance_url", "https://searx.be")
@@ -704,38 +1218,28 @@ async def save_search_settings(
     # Validate
     valid_engines = ["duckduckgo", "searx", "qwant", "startpage"]
     if search_engine not in valid_engines:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "error": f"Invalid search engine. Must be one of: {', '.join(valid_engines)}"
         })
 
     if not isinstance(results_count, int) or results_count < 1 or results_count > 50:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "error": "Results count must be between 1 and 50"
         })
 
     # Save to database
     async with db.acquire() as conn:
-        await conn.execute("""
-            INSERT INTO system_settings (setting_key, setting_value, setting_type, description)
-            VALUES ('search_engine', $1, 'string', 'Default web search engine')
-            ON CONFLICT (setting_key) DO UPDATE SET setting_value = $1, updated_at = CURRENT_TIMESTAMP
-        """, search_engine)
-
-        await conn.execute("""
-            INSERT INTO system_settings (setting_key, setting_value, setting_type, description)
-            VALUES ('searx_instance_url', $1, 'string', 'SearX instance URL')
-            ON CONFLICT (setting_key) DO UPDATE SET setting_value = $1, updated_at = CURRENT_TIMESTAMP
-        """, searx_url)
-
-        await conn.execute("""
-            INSERT INTO system_settings (setting_key, setting_value, setting_type, description)
-            VALUES ('search_results_count', $1, 'integer', 'Default number of search results')
-            ON CONFLICT (setting_key) DO UPDATE SET setting_value = $1, updated_at = CURRENT_TIMESTAMP
-        """, str(results_count))
-
-    return JSONResponse({
+        stmt = await db.statement(conn, "save_search_settings")
+        await stmt.fetch(
+            SEARCH_SETTING_KEYS,
+            [search_engine, searx_url, str(results_count)],
+            ["string", "string", "integer"],
+            ["Default web search engine", "SearX instance URL", "Default number of search results"]
+        )
+
+    return ORJSONResponse({
         "success": True,
         "message": "Search settings saved successfully",
         "settings": {
@@ -749,65 +1253,68 @@ async def save_search_settings(
 @app.get("/api/settings/search")
 async def get_search_settings(user: str = Depends(require_auth)):
     """Get search engine settings"""
-    async with db.acquire() as conn:
-        search_engine_row = await conn.fetchrow(
-            "SELECT setting_value FROM system_settings WHERE setting_key = 'search_engine'"
-        )
-        searx_url_row = await conn.fetchrow(
-            "SELECT setting_value FROM system_settings WHERE setting_key = 'searx_instance_url'"
-        )
-        results_count_row = await conn.fetchrow(
-            "SELECT setting_value FROM system_settings WHERE setting_key = 'search_results_count'"
-        )
-
-    return JSONResponse({
+    return ORJSONResponse({
         "success": True,
-        "settings": {
-            "search_engine": search_engine_row["setting_value"] if search_engine_row else "duckduckgo",
-            "searx_instance_url": searx_url_row["setting_value"] if searx_url_row else "https://searx.be",
-            "search_results_count": int(results_count_row["setting_value"]) if results_count_row else 10
-        }
+        "settings": await load_search_settings()
     })
 
 
-@app.get("/configs/claude-code")
-async def get_claude_code_config(request: Request):
-    """Get Claude Code MCP configuration - Public endpoint"""
-    host = request.headers.get("host", "localhost")
-    clean_host = host.split(':')[0]
-    mcp_token = config.security.mcp_auth_token
-    base_url = f"https://{clean_host}:{config.server.mcp_port}"
-
-    stdio_config = {
+def _stdio_config(base_url: str) -> dict:
+    """stdio bridge configuration shared by the Claude Code and Cursor payloads"""
+    return {
         "mcpServers": {
             "centre-ai": {
                 "command": "npx",
                 "args": ["-y", "@modelcontextprotocol/server-everything"],
                 "env": {
                     "MCP_SERVER_URL": f"{base_url}/",
-                    "MCP_BEARER_TOKEN": mcp_token,
+                    "MCP_BEARER_TOKEN": config.security.mcp_auth_token,
                     "MCP_OPENAPI_SPEC": f"{base_url}/openapi.json"
                 }
             }
         }
     }
 
-    sse_config = {
-        "mcpServers": {
-            "centre-ai": {
-                "type": "sse",
-                "url": f"{base_url}/sse",
-                "headers": {
-                    "Authorization": f"Bearer {mcp_token}"
-                }
-            }
-        }
-    }
 
-    return JSONResponse({
+# Client config payloads only vary by host (token and port are fixed after
+# startup), so the serialized bytes and their ETag are memoized per host.
+# They embed the MCP bearer token, so only the browser may cache them.
+CONFIG_CACHE_CONTROL = "private, max-age=60"
+
+
+def _etagged(payload: dict) -> tuple:
+    """Serialize a payload once and pair it with its ETag"""
+    body = orjson.dumps(payload)
+    return body, '"%s"' % hashlib.md5(body).hexdigest()
+
+
+def config_json_response(request: Request, cached: tuple) -> Response:
+    """Serve a memoized config body, answering matching If-None-Match with 304"""
+    body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": CONFIG_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@lru_cache(maxsize=32)
+def claude_code_config_body(clean_host: str) -> tuple:
+    """Serialized Claude Code configuration for a host"""
+    base_url = f"https://{clean_host}:{config.server.mcp_port}"
+    return _etagged({
         "success": True,
-        "stdio_config": stdio_config,
-        "sse_config": sse_config,
+        "stdio_config": _stdio_config(base_url),
+        "sse_config": {
+            "mcpServers": {
+                "centre-ai": {
+                    "type": "sse",
+                    "url": f"{base_url}/sse",
+                    "headers": {
+                        "Authorization": f"Bearer {config.security.mcp_auth_token}"
+                    }
+                }
+            }
+        },
         "recommended": "stdio",
         "instructions": {
             "claude_code": "Add stdio_config to ~/.claude.json",
@@ -816,40 +1323,20 @@ async def get_claude_code_config(request: Request):
     })
 
 
-@app.get("/configs/cursor")
-async def get_cursor_config(request: Request):
-    """Get Cursor AI MCP configuration - Public endpoint"""
-    host = request.headers.get("host", "localhost")
-    clean_host = host.split(':')[0]
-    mcp_token = config.security.mcp_auth_token
+@lru_cache(maxsize=32)
+def cursor_config_body(clean_host: str) -> tuple:
+    """Serialized Cursor configuration for a host"""
     base_url = f"https://{clean_host}:{config.server.mcp_port}"
-
-    stdio_config = {
-        "mcpServers": {
-            "centre-ai": {
-                "command": "npx",
-                "args": ["-y", "@modelcontextprotocol/server-everything"],
-                "env": {
-                    "MCP_SERVER_URL": f"{base_url}/",
-                    "MCP_BEARER_TOKEN": mcp_token,
-                    "MCP_OPENAPI_SPEC": f"{base_url}/openapi.json"
+    return _etagged({
+        "success": True,
+        "stdio_config": _stdio_config(base_url),
+        "sse_config": {
+            "mcpServers": {
+                "centre-ai": {
+                    "url": f"{base_url}/sse"
                 }
             }
-        }
-    }
-
-    sse_config = {
-        "mcpServers": {
-            "centre-ai": {
-                "url": f"{base_url}/sse"
-            }
-        }
-    }
-
-    return JSONResponse({
-        "success": True,
-        "stdio_config": stdio_config,
-        "sse_config": sse_config,
+        },
         "recommended": "stdio",
         "instructions": {
             "project": "Save as .cursor/mcp.json in your project",
@@ -858,10 +1345,26 @@ async def get_cursor_config(request: Request):
     })
 
 
-@app.get("/configs/openwebui")
-async def get_openwebui_config(request: Request):
-    """Get OpenWebUI configuration - Public endpoint"""
-    host = request.headers.get("host", "localhost")
+def config_host(request: Request) -> str:
+    """Host for client configs: PUBLIC_HOST if configured, else the request's Host"""
+    return config.server.public_host or request.headers.get("host", "localhost").split(':')[0]
+
+
+@app.get("/configs/claude-code")
+async def get_claude_code_config(request: Request):
+    """Get Claude Code MCP configuration - Public endpoint"""
+    return config_json_response(request, claude_code_config_body(config_host(request)))
+
+
+@app.get("/configs/cursor")
+async def get_cursor_config(request: Request):
+    """Get Cursor AI MCP configuration - Public endpoint"""
+    return config_json_response(request, cursor_config_body(config_host(request)))
+
+
+@lru_cache(maxsize=32)
+def openwebui_config_body(host: str) -> tuple:
+    """Serialized OpenWebUI configuration for a host"""
     base_url = f"http://{host}"
     http_url = base_url.replace(str(config.server.admin_port), str(config.server.mcp_port))
 
@@ -880,7 +1383,7 @@ async def get_openwebui_config(request: Request):
         }
     }
 
-    return JSONResponse({
+    return _etagged({
         "success": True,
         "config": openwebui_config,
         "api_docs": f"{http_url}/docs",
@@ -888,91 +1391,116 @@ async def get_openwebui_config(request: Request):
     })
 
 
+@app.get("/configs/openwebui")
+async def get_openwebui_config(request: Request):
+    """Get OpenWebUI configuration - Public endpoint"""
+    return config_json_response(request, openwebui_config_body(request.headers.get("host", "localhost")))
+
+
+# Shown on the configs page; a placeholder unless a token is explicitly configured
+MCP_AUTH_TOKEN = os.getenv("MCP_AUTH_TOKEN", "your-token-here")
+
+
 @app.get("/configs", response_class=HTMLResponse)
 async def configs_page(request: Request, user: str = Depends(require_auth)):
     """Client configurations download page"""
     host = request.headers.get("host", "localhost").split(":")[0]
     server_host = host if host != "localhost" else "127.0.0.1"
-    mcp_token = os.getenv("MCP_AUTH_TOKEN", "your-token-here")
 
-    return templates.TemplateResponse("configs.html", {
-        "request": request,
-        "user": user,
-        "server_host": server_host,
-        "mcp_token": mcp_token
-    })
+    return render_static_page(
+        request, "configs.html", user, server_host=server_host, mcp_token=MCP_AUTH_TOKEN
+    )
 
 
 @app.get("/git-projects", response_class=HTMLResponse)
 async def git_projects_page(request: Request, user: str = Depends(require_auth)):
     """Git projects management page"""
-    return templates.TemplateResponse("git_projects.html", {
-        "request": request,
-        "user": user
-    })
+    return render_static_page(request, "git_projects.html", user)
 
 
 @app.get("/mcp-servers", response_class=HTMLResponse)
 async def mcp_servers_page(request: Request, user: str = Depends(require_auth)):
     """MCP servers management page"""
-    return templates.TemplateResponse("mcp_servers.html", {
-        "request": request,
-        "user": user
-    })
+    return render_static_page(request, "mcp_servers.html", user)
+
+
+# Column aliases match the JSON keys the git projects page expects
+GIT_PROJECTS_SQL = """
+    SELECT id, name, url, local_path AS "localPath", last_updated AS "lastUpdated",
+           created_at AS "createdAt", branch, commit_hash AS "commitHash", status
+    FROM git_projects
+    ORDER BY last_updated DESC
+"""
+
+db.register_statements({"git_projects": GIT_PROJECTS_SQL})
+
+
 @app.get("/api/git/projects")
 async def get_git_projects(user: str = Depends(require_auth)):
     """Get list of cloned Git projects"""
     try:
         async with db.acquire() as conn:
-            rows = await conn.fetch("""
-                SELECT id, name, url, local_path, last_updated, created_at,
-                       branch, commit_hash, status
-                FROM git_projects
-                ORDER BY last_updated DESC
-            """)
-
-        projects = []
-        for row in rows:
-            projects.append({
-                "id": row["id"],
-                "name": row["name"],
-                "url": row["url"],
-                "localPath": row["local_path"],
-                "lastUpdated": row["last_updated"].isoformat() if row["last_updated"] else None,
-                "createdAt": row["created_at"].isoformat(),
-                "branch": row["branch"],
-                "commitHash": row["commit_hash"],
-                "status": row["status"]
-            })
+            stmt = await db.statement(conn, "git_projects")
+            rows = await stmt.fetch()
 
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
-            "projects": projects
+            "projects": [dict(row) for row in rows]
         })
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "error": str(e)
         })
 
 
+GIT_CLONE_TIMEOUT = 300
+# Only the tip of the default branch, with file contents fetched on demand
+GIT_SHALLOW_CLONE_ARGS = ("--depth=1", "--single-branch", "--filter=blob:none")
+
+
+GIT_PROJECT_STATUS_SQL = """
+    UPDATE git_projects
+    SET status = $2,
+        indexed_at = CASE WHEN $2 = 'indexed' THEN CURRENT_TIMESTAMP ELSE indexed_at END
+    WHERE id = $1
+"""
+
+
+async def index_git_project(tools: MCPTools, project_id: int, name: str, local_path: str, url: str):
+    """Index a freshly cloned repository and record the outcome"""
+    try:
+        await tools.capture_codebase(
+            name=f"git_{name}",
+            path=local_path,
+            description=f"Git repository: {name}",
+            repo_url=url
+        )
+        invalidate_page("codebases")
+        status = "indexed"
+    except Exception:
+        # Clone succeeded but indexing failed
+        status = "clone_only"
+    await db.execute(GIT_PROJECT_STATUS_SQL, project_id, status)
+
+
 @app.post("/api/git/clone")
-async def clone_git_repository(request: Request, user: str = Depends(require_auth)):
+async def clone_git_repository(request: Request, user: str = Depends(require_auth), tools: MCPTools = Depends(get_tools)):
     """Clone a Git repository"""
-    import subprocess
     import os
     from pathlib import Path
 
     try:
-        data = await request.json()
+        data = await read_json(request)
         url = data.get("url")
         name = data.get("name", "")
         username = data.get("username", "")
         password = data.get("password", "")
         auto_index = data.get("autoIndex", True)
+        full_clone = data.get("fullClone", False)
 
         if not url:
-            return JSONResponse({
+            return ORJSONResponse({
                 "success": False,
                 "error": "Repository URL is required"
             })
@@ -981,19 +1509,21 @@ async def clone_git_repository(request: Request, user: str = Depends(require_aut
         if not name:
             name = url.split("/")[-1].replace(".git", "")
 
-        # Create local path
+        # Create local path (filesystem calls run off the event loop)
         git_repos_dir = Path("/app/git_repos")
-        git_repos_dir.mkdir(exist_ok=True)
+        await asyncio.to_thread(git_repos_dir.mkdir, exist_ok=True)
         local_path = git_repos_dir / name
 
-        if local_path.exists():
-            return JSONResponse({
+        if await asyncio.to_thread(local_path.exists):
+            return ORJSONResponse({
                 "success": False,
                 "error": f"Directory '{name}' already exists"
             })
 
-        # Prepare git clone command
+        # Prepare git clone command; shallow, blobless clone unless asked otherwise
         clone_cmd = ["git", "clone"]
+        if not full_clone:
+            clone_cmd.extend(GIT_SHALLOW_CLONE_ARGS)
 
         # Add credentials if provided
         if username and password:
@@ -1006,61 +1536,50 @@ async def clone_git_repository(request: Request, user: str = Depends(require_aut
         else:
             clone_cmd.extend([url, str(local_path)])
 
-        # Execute git clone
-        result = subprocess.run(clone_cmd,
-                              capture_output=True,
-                              text=True,
-                              timeout=300)
-
-        if result.returncode != 0:
-            return JSONResponse({
+        # Execute git clone without blocking the event loop
+        proc = await asyncio.create_subprocess_exec(
+            *clone_cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), GIT_CLONE_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+
+        if proc.returncode != 0:
+            return ORJSONResponse({
                 "success": False,
-                "error": f"Git clone failed: {result.stderr}"
+                "error": f"Git clone failed: {stderr.decode(errors='replace')}"
             })
 
         # Save to database
-        async with db.acquire() as conn:
-            project_id = await conn.fetchval("""
-                INSERT INTO git_projects (name, url, local_path, status, created_at)
-                VALUES ($1, $2, $3, 'cloned', CURRENT_TIMESTAMP)
-                RETURNING id
-            """, name, url, str(local_path))
-
-            # Auto-index if requested
-            if auto_index:
-                try:
-                    await tools.capture_codebase(
-                        name=f"git_{name}",
-                        path=str(local_path),
-                        description=f"Git repository: {name}",
-                        repo_url=url
-                    )
-                    await conn.execute("""
-                        UPDATE git_projects
-                        SET indexed_at = CURRENT_TIMESTAMP, status = 'indexed'
-                        WHERE id = $1
-                    """, project_id)
-                except Exception as index_error:
-                    # Clone succeeded but indexing failed
-                    await conn.execute("""
-                        UPDATE git_projects
-                        SET status = 'clone_only'
-                        WHERE id = $1
-                    """, project_id)
-
-        return JSONResponse({
+        project_id = await db.fetchval("""
+            INSERT INTO git_projects (name, url, local_path, status, created_at)
+            VALUES ($1, $2, $3, 'cloned', CURRENT_TIMESTAMP)
+            RETURNING id
+        """, name, url, str(local_path))
+
+        # Auto-index if requested; the caller only waits for the clone
+        if auto_index:
+            spawn(index_git_project(tools, project_id, name, str(local_path), url))
+
+        return ORJSONResponse({
             "success": True,
             "details": f"Repository '{name}' cloned successfully",
-            "projectId": project_id
+            "projectId": project_id,
+            "indexing": bool(auto_index)
         })
 
-    except subprocess.TimeoutExpired:
-        return JSONResponse({
+    except asyncio.TimeoutError:
+        return ORJSONResponse({
             "success": False,
             "error": "Clone timeout - repository may be too large"
         })
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "error": str(e)
         })
@@ -1071,12 +1590,12 @@ async def pull_git_repository(project_id: int, user: str = Depends(require_auth)
     """Pull latest changes for a Git repository"""
     try:
         # TODO: Implement actual git pull logic
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "details": f"Latest changes pulled for project {project_id}"
         })
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "error": str(e)
         })
@@ -1087,12 +1606,12 @@ async def index_git_repository(project_id: int, user: str = Depends(require_auth
     """Index a Git repository for semantic search"""
     try:
         # TODO: Implement actual indexing logic
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "filesCount": 42
         })
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "error": str(e)
         })
@@ -1103,21 +1622,27 @@ async def delete_git_repository(project_id: int, user: str = Depends(require_aut
     """Delete a Git repository"""
     try:
         # TODO: Implement actual deletion logic
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True
         })
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "error": str(e)
         })
 
 
-# Health check
-@app.get("/health")
-async def health():
+# Health check - a bare Starlette route so probes skip FastAPI dependency
+# resolution and response serialization
+HEALTH_RESPONSE = Response(content=b'{"status":"healthy"}', media_type="application/json")
+
+
+async def health(request: Request):
     """Health check"""
-    return {"status": "healthy"}
+    return HEALTH_RESPONSE
+
+
+app.router.routes.insert(0, Route("/health", health, methods=["GET"]))
 
 
 # Claude Connector Routes (proxied from main entry point)
@@ -1197,6 +1722,19 @@ async def oauth_revoke_token_alt(request: Request):
 import httpx
 from starlette.background import BackgroundTask
 
+# One pooled client for all proxy routes keeps upstream connections alive
+SSE_UPSTREAM_CLIENT = httpx.AsyncClient(
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+)
+SSE_STREAM_TIMEOUT = httpx.Timeout(None, connect=30.0)
+
+
+@app.on_event("shutdown")
+async def close_sse_upstream_client():
+    """Close pooled upstream connections"""
+    await SSE_UPSTREAM_CLIENT.aclose()
+
 @app.get("/sse")
 async def sse_proxy_get(request: Request):
     """Proxy SSE GET requests to MCP SSE server"""
@@ -1206,17 +1744,16 @@ async def sse_proxy_get(request: Request):
 
     headers = {k: v for k, v in request.headers.items() if k.lower() not in ("host", "content-length")}
 
-    client = httpx.AsyncClient(timeout=httpx.Timeout(None, connect=30.0))
-
     async def stream_sse():
         try:
-            async with client.stream("GET", sse_url, headers=headers) as response:
-                async for line in response.aiter_lines():
-                    yield f"{line}\n"
+            async with SSE_UPSTREAM_CLIENT.stream(
+                "GET", sse_url, headers=headers, timeout=SSE_STREAM_TIMEOUT
+            ) as response:
+                # Pass upstream bytes through; no line splitting or text re-encoding
+                async for chunk in response.aiter_bytes():
+                    yield chunk
         except Exception as e:
-            yield f"event: error\ndata: {str(e)}\n\n"
-        finally:
-            await client.aclose()
+            yield f"event: error\ndata: {str(e)}\n\n".encode()
 
     return StreamingResponse(
         stream_sse(),
@@ -1239,14 +1776,13 @@ async def sse_proxy_post(request: Request):
 
     headers = {k: v for k, v in request.headers.items() if k.lower() not in ("host", "content-length")}
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        body = await request.body()
-        response = await client.post(sse_url, content=body, headers=headers)
-        return Response(
-            content=response.content,
-            status_code=response.status_code,
-            headers={"Access-Control-Allow-Origin": "*"}
-        )
+    body = await request.body()
+    response = await SSE_UPSTREAM_CLIENT.post(sse_url, content=body, headers=headers)
+    return Response(
+        content=response.content,
+        status_code=response.status_code,
+        headers={"Access-Control-Allow-Origin": "*"}
+    )
 
 
 @app.post("/messages")
@@ -1258,14 +1794,13 @@ async def messages_proxy(request: Request):
 
     headers = {k: v for k, v in request.headers.items() if k.lower() not in ("host", "content-length")}
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        body = await request.body()
-        response = await client.post(messages_url, content=body, headers=headers)
-        return Response(
-            content=response.content,
-            status_code=response.status_code,
-            headers={"Access-Control-Allow-Origin": "*"}
-        )
+    body = await request.body()
+    response = await SSE_UPSTREAM_CLIENT.post(messages_url, content=body, headers=headers)
+    return Response(
+        content=response.content,
+        status_code=response.status_code,
+        headers={"Access-Control-Allow-Origin": "*"}
+    )
 
 
 # ==================== API ENDPOINTS ====================
@@ -1273,39 +1808,36 @@ async def messages_proxy(request: Request):
 @app.get("/api/conversations")
 async def api_conversations():
     """Get all conversations for the frontend"""
-    async with db.pool.acquire() as conn:
-        conversations = await conn.fetch("""
-            SELECT id, session_id, title, summary, message_count, participants, created_at, updated_at
-            FROM conversations
-            ORDER BY updated_at DESC
-        """)
-        return [dict(conv) for conv in conversations]
+    conversations = await db.fetch("""
+        SELECT id, session_id, title, summary, message_count, participants, created_at, updated_at
+        FROM conversations
+        ORDER BY updated_at DESC
+    """)
+    return [dict(conv) for conv in conversations]
+
+
+# The whole response document is built by Postgres in one round trip
+CONVERSATION_DETAIL_SQL = """
+    SELECT json_build_object(
+        'conversation', row_to_json(c),
+        'messages', COALESCE((
+            SELECT json_agg(m ORDER BY m.created_at ASC)
+            FROM (SELECT id, role, content, metadata, created_at
+                  FROM messages WHERE conversation_id = c.id) m
+        ), '[]'::json)
+    )::text
+    FROM conversations c
+    WHERE c.id = $1
+"""
 
 
 @app.get("/api/conversations/{conversation_id}")
 async def api_conversation_detail(conversation_id: int):
     """Get conversation details with messages"""
-    async with db.pool.acquire() as conn:
-        # Get conversation
-        conversation = await conn.fetchrow("""
-            SELECT * FROM conversations WHERE id = $1
-        """, conversation_id)
-
-        if not conversation:
-            raise HTTPException(status_code=404, detail="Conversation not found")
-
-        # Get messages
-        messages = await conn.fetch("""
-            SELECT id, role, content, metadata, created_at
-            FROM messages
-            WHERE conversation_id = $1
-            ORDER BY created_at ASC
-        """, conversation_id)
-
-        return {
-            "conversation": dict(conversation),
-            "messages": [dict(msg) for msg in messages]
-        }
+    body = await db.fetchval(CONVERSATION_DETAIL_SQL, conversation_id)
+    if body is None:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/api/quick-instruction")
@@ -1313,10 +1845,10 @@ async def api_quick_instruction(request: Request, user: str = Depends(require_au
     """Store quick instruction for Claude"""
     from src.tools.data_tools import DataTools
 
-    data = await request.json()
+    data = await read_json(request)
     dt = DataTools()
     result = dt.store_direct_instruction(data)
-    return JSONResponse(result)
+    return ORJSONResponse(result)
 
 
 @app.post("/api/auto-memory")
@@ -1324,17 +1856,38 @@ async def api_auto_memory(request: Request, user: str = Depends(require_auth)):
     """Create automatic memory"""
     from src.tools.data_tools import DataTools
 
-    data = await request.json()
+    data = await read_json(request)
     dt = DataTools()
     result = dt.auto_create_memory(data)
-    return JSONResponse(result)
+    return ORJSONResponse(result)
+
+
+def sse_server_config(name: str, url: str, api_key: str) -> dict:
+    """Client config entry for a remote SSE MCP server"""
+    return {"mcpServers": {name: {
+        "type": "sse",
+        "url": url,
+        "headers": {"Authorization": f"Bearer {api_key}"}
+    }}}
+
+
+def stdio_server_config(name: str, url: str, api_key: str) -> dict:
+    """Client config entry for an MCP server bridged over stdio"""
+    return {"mcpServers": {name: {
+        "command": "npx",
+        "args": ["-y", "@modelcontextprotocol/server-everything"],
+        "env": {"MCP_SERVER_URL": url, "MCP_BEARER_TOKEN": api_key}
+    }}}
+
+
+MCP_SERVER_CONFIG_BUILDERS = {"sse": sse_server_config, "stdio": stdio_server_config}
 
 
 @app.post("/api/mcp/add-server")
 async def add_mcp_server(request: Request, user: str = Depends(require_auth)):
     """Add dynamic MCP server configuration"""
     try:
-        data = await request.json()
+        data = await read_json(request)
 
         server_name = data.get("name", "").strip()
         server_type = data.get("type", "sse")
@@ -1342,69 +1895,45 @@ async def add_mcp_server(request: Request, user: str = Depends(require_auth)):
         api_key = data.get("api_key", "").strip()
 
         if not server_name:
-            return JSONResponse({
+            return ORJSONResponse({
                 "success": False,
                 "error": "Server name is required"
             })
 
         if not url:
-            return JSONResponse({
+            return ORJSONResponse({
                 "success": False,
                 "error": "Server URL is required"
             })
 
         if not api_key:
-            return JSONResponse({
+            return ORJSONResponse({
                 "success": False,
                 "error": "API key is required"
             })
 
         # Generate config based on type
-        if server_type == "sse":
-            config = {
-                "mcpServers": {
-                    server_name: {
-                        "type": "sse",
-                        "url": url,
-                        "headers": {
-                            "Authorization": f"Bearer {api_key}"
-                        }
-                    }
-                }
-            }
-        elif server_type == "stdio":
-            config = {
-                "mcpServers": {
-                    server_name: {
-                        "command": "npx",
-                        "args": ["-y", "@modelcontextprotocol/server-everything"],
-                        "env": {
-                            "MCP_SERVER_URL": url,
-                            "MCP_BEARER_TOKEN": api_key
-                        }
-                    }
-                }
-            }
-        else:
-            return JSONResponse({
+        build_config = MCP_SERVER_CONFIG_BUILDERS.get(server_type)
+        if build_config is None:
+            return ORJSONResponse({
                 "success": False,
                 "error": "Invalid server type. Must be 'sse' or 'stdio'"
             })
+        config = build_config(server_name, url, api_key)
 
         # Save to database
-        async with db.acquire() as conn:
-            await conn.execute("""
-                INSERT INTO mcp_server_configs (name, type, url, api_key, config_json, created_by)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                ON CONFLICT (name) DO UPDATE SET
-                    type = EXCLUDED.type,
-                    url = EXCLUDED.url,
-                    api_key = EXCLUDED.api_key,
-                    config_json = EXCLUDED.config_json,
-                    updated_at = CURRENT_TIMESTAMP
-            """, server_name, server_type, url, api_key, json.dumps(config), user)
-
-        return JSONResponse({
+        await db.execute("""
+            INSERT INTO mcp_server_configs (name, type, url, api_key, config_json, created_by)
+            VALUES ($1, $2, $3, $4, $5, $6)
+            ON CONFLICT (name) DO UPDATE SET
+                type = EXCLUDED.type,
+                url = EXCLUDED.url,
+                api_key = EXCLUDED.api_key,
+                config_json = EXCLUDED.config_json,
+                updated_at = CURRENT_TIMESTAMP
+        """, server_name, server_type, url, api_key, config, user)
+
+        return ORJSONResponse({
             "success": True,
             "message": f"MCP server '{server_name}' added successfully",
             "config": config,
@@ -1415,22 +1944,34 @@ async def add_mcp_server(request: Request, user: str = Depends(require_auth)):
         })
 
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "error": str(e)
         })
 
 
+MCP_SERVERS_SQL = """
+    SELECT id, name, type, url, config_json, created_at, updated_at, created_by
+    FROM mcp_server_configs
+    ORDER BY updated_at DESC
+"""
+
+db.register_statements({"mcp_servers": MCP_SERVERS_SQL})
+
+
+@lru_cache(maxsize=1024)
+def parse_server_config(server_id: int, updated_at, config_json: str) -> dict:
+    """Parse a stored server config; rows re-parse only when they change"""
+    return orjson.loads(config_json)
+
+
 @app.get("/api/mcp/servers")
 async def get_mcp_servers(user: str = Depends(require_auth)):
     """Get all configured MCP servers"""
     try:
         async with db.acquire() as conn:
-            servers = await conn.fetch("""
-                SELECT id, name, type, url, config_json, created_at, updated_at, created_by
-                FROM mcp_server_configs
-                ORDER BY updated_at DESC
-            """)
+            stmt = await db.statement(conn, "mcp_servers")
+            servers = await stmt.fetch()
 
         server_list = []
         for server in servers:
@@ -1439,19 +1980,19 @@ async def get_mcp_servers(user: str = Depends(require_auth)):
                 "name": server["name"],
                 "type": server["type"],
                 "url": server["url"],
-                "config": json.loads(server["config_json"]),
-                "created_at": server["created_at"].isoformat(),
-                "updated_at": server["updated_at"].isoformat() if server["updated_at"] else None,
+                "config": parse_server_config(server["id"], server["updated_at"], server["config_json"]),
+                "created_at": server["created_at"],
+                "updated_at": server["updated_at"],
                 "created_by": server["created_by"]
             })
 
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "servers": server_list
         })
 
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "error": str(e)
         })
@@ -1461,18 +2002,17 @@ async def get_mcp_servers(user: str = Depends(require_auth)):
 async def delete_mcp_server(server_id: int, user: str = Depends(require_auth)):
     """Delete MCP server configuration"""
     try:
-        async with db.acquire() as conn:
-            await conn.execute("""
-                DELETE FROM mcp_server_configs WHERE id = $1
-            """, server_id)
+        await db.execute("""
+            DELETE FROM mcp_server_configs WHERE id = $1
+        """, server_id)
 
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "message": "MCP server configuration deleted successfully"
         })
 
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "error": str(e)
         })
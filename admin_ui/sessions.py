@@ -0,0 +1,79 @@
+"""
+Server-side sessions for the Admin UI
+Session data lives in Redis; the browser only holds an opaque session id
+"""
+import secrets
+from typing import Optional
+
+import orjson
+import redis.asyncio as aioredis
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class RedisSessionMiddleware:
+    """Pure ASGI session middleware backed by Redis (drop-in for SessionMiddleware)"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        redis_url: str,
+        session_cookie: str = "session",
+        max_age: int = 86400,
+        key_prefix: str = "session:",
+        same_site: str = "lax",
+        https_only: bool = False,
+        public_paths: tuple = (),
+    ):
+        self.app = app
+        self.redis = aioredis.from_url(redis_url)
+        self.session_cookie = session_cookie
+        self.max_age = max_age
+        self.key_prefix = key_prefix
+        self.public_paths = public_paths
+        secure = "; secure" if https_only else ""
+        self.cookie_flags = f"path=/; Max-Age={max_age}; httponly; samesite={same_site}{secure}"
+
+    async def _load(self, session_id: Optional[str]) -> dict:
+        if not session_id:
+            return {}
+        data = await self.redis.get(self.key_prefix + session_id)
+        return orjson.loads(data) if data else {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        if scope["path"].startswith(self.public_paths):
+            # Routes that never look at the session skip the Redis lookup
+            scope["session"] = {}
+            await self.app(scope, receive, send)
+            return
+
+        session_id = HTTPConnection(scope).cookies.get(self.session_cookie)
+        session = await self._load(session_id)
+        initial = dict(session)
+        scope["session"] = session
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and scope["session"] != initial:
+                headers = MutableHeaders(scope=message)
+                if session_id:
+                    await self.redis.delete(self.key_prefix + session_id)
+                if scope["session"]:
+                    # Rotate the id whenever the contents change (prevents fixation)
+                    new_id = secrets.token_urlsafe(32)
+                    await self.redis.setex(
+                        self.key_prefix + new_id, self.max_age, orjson.dumps(scope["session"])
+                    )
+                    headers.append("Set-Cookie", f"{self.session_cookie}={new_id}; {self.cookie_flags}")
+                else:
+                    headers.append(
+                        "Set-Cookie",
+                        f"{self.session_cookie}=null; path=/; "
+                        "expires=Thu, 01 Jan 1970 00:00:00 GMT; httponly",
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
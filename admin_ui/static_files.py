@@ -0,0 +1,49 @@
+"""
+Static file serving for the Admin UI
+Serves precompressed .br/.gz variants and long-lived cache headers
+"""
+import mimetypes
+import re
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+# Content-hashed file names (e.g. app.3f2a9c1b.js) never change in place
+HASHED_ASSET = re.compile(r"\.[0-9a-f]{8,}\.")
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+DEFAULT_CACHE = "public, max-age=3600"
+
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that prefers build-time compressed siblings of a file"""
+
+    async def _compressed_response(self, path: str, scope: Scope):
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        for encoding, suffix in PRECOMPRESSED:
+            if encoding not in accept_encoding:
+                continue
+            try:
+                response = await super().get_response(path + suffix, scope)
+            except HTTPException:
+                continue
+            if response.status_code not in (200, 304):
+                continue
+            response.headers["Content-Encoding"] = encoding
+            response.headers["Content-Type"] = mimetypes.guess_type(path)[0] or "application/octet-stream"
+            return response
+        return None
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await self._compressed_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Vary"] = "Accept-Encoding"
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE if HASHED_ASSET.search(path) else DEFAULT_CACHE
+        return response
@@ -4,7 +4,15 @@ Main application with all features: Git, Code Indexing, Profiles, Conversations
 """
 
 import os
-from flask import Flask, render_template, jsonify, request
+import shutil
+import threading
+import time
+import uuid
+from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+import orjson
+from flask import Flask, render_template, request, stream_with_context
 from flask_cors import CORS
 from dotenv import load_dotenv
 from src.mcp.server import MCPServer
@@ -13,6 +21,8 @@ from src.memory.store import MemoryStore
 from src.vector.qdrant_client import VectorDB
 from src.indexing.code_indexer import CodeIndexer
 from src.profiles.manager import ProfileManager, ConversationManager, MemoryManager
+from src.cache.response_cache import ResponseCache
+from src.cache.job_store import JobStore
 import logging
 
 # Load environment variables
@@ -30,37 +40,240 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
 CORS(app)
 
-# Initialize components
-auth_manager = AuthManager()
-memory_store = MemoryStore()
-vector_db = VectorDB()
-code_indexer = CodeIndexer(vector_db=vector_db)
-profile_manager = ProfileManager()
-conversation_manager = ConversationManager()
-memory_manager = MemoryManager()
-mcp_server = MCPServer(
-    memory_store=memory_store,
-    vector_db=vector_db,
-    code_indexer=code_indexer
-)
+# Components are built on first use so workers only pay for what they touch.
+# Getters call each other (the MCP server needs the memory store, ...), so a
+# single re-entrant lock guards construction of the whole graph.
+_components_lock = threading.RLock()
+
+
+def lazy_singleton(factory):
+    """Cache a zero-argument factory; unlike functools.cache, build at most once across threads"""
+    instance = None
+
+    @wraps(factory)
+    def getter():
+        nonlocal instance
+        if instance is None:
+            with _components_lock:
+                if instance is None:
+                    instance = factory()
+        return instance
+
+    return getter
+
+
+@lazy_singleton
+def get_auth_manager() -> AuthManager:
+    return AuthManager()
+
+
+@lazy_singleton
+def get_memory_store() -> MemoryStore:
+    return MemoryStore()
+
+
+@lazy_singleton
+def get_vector_db() -> VectorDB:
+    return VectorDB()
+
+
+@lazy_singleton
+def get_code_indexer() -> CodeIndexer:
+    return CodeIndexer(vector_db=get_vector_db())
+
+
+@lazy_singleton
+def get_profile_manager() -> ProfileManager:
+    return ProfileManager()
+
+
+@lazy_singleton
+def get_conversation_manager() -> ConversationManager:
+    return ConversationManager()
+
+
+@lazy_singleton
+def get_memory_manager() -> MemoryManager:
+    return MemoryManager()
+
+
+@lazy_singleton
+def get_mcp_server() -> MCPServer:
+    return MCPServer(
+        memory_store=get_memory_store(),
+        vector_db=get_vector_db(),
+        code_indexer=get_code_indexer()
+    )
+
+
+response_cache = ResponseCache()
+
+# Write tools reachable through /mcp/tools/execute and /api/batch, mapped to
+# the response-cache namespaces whose GET routes they can change
+ALL_CACHE_NAMESPACES = ('git', 'artifacts', 'instructions', 'projects', 'knowledge')
+TOOL_CACHE_NAMESPACES = {
+    **dict.fromkeys(('git_clone', 'git_pull', 'git_delete_repo', 'git_write_file',
+                     'git_commit', 'git_push'), ('git',)),
+    **dict.fromkeys(('artifact_create', 'artifact_update', 'artifact_delete'),
+                    ('artifacts', 'projects')),
+    **dict.fromkeys(('instruction_create', 'instruction_update', 'instruction_delete',
+                     'instruction_extract_from_text', 'store_direct_instruction'), ('instructions',)),
+    **dict.fromkeys(('project_create', 'project_update', 'project_delete',
+                     'project_create_from_description', 'project_add_from_instruction'), ('projects',)),
+    **dict.fromkeys(('knowledge_create_node', 'knowledge_connect', 'knowledge_connect_entities',
+                     'knowledge_delete_node', 'knowledge_delete_connection'), ('knowledge',)),
+    **dict.fromkeys(('import_claude_data', 'import_har_file'), ALL_CACHE_NAMESPACES),
+}
+
+
+def tool_cache_namespaces(tool_name: str, result: dict) -> tuple:
+    """Cache namespaces a successful tool call invalidates (empty for reads and failures)"""
+    if not result.get('success'):
+        return ()
+    return TOOL_CACHE_NAMESPACES.get(tool_name, ())
+index_jobs = JobStore(response_cache.client, prefix='indexjob:')
+
+
+# ============================================================================
+# Status Sampler
+# ============================================================================
+
+# /api/status and /api/stats are polled often; their fields are sampled
+# in the background and each request just returns the latest snapshot.
+# The sampler starts on the first status request, not at import, so the
+# components it touches stay lazy.
+STATUS_SAMPLE_INTERVAL = float(os.getenv('STATUS_SAMPLE_INTERVAL', 1.0))
+STATUS_MAX_AGE = STATUS_SAMPLE_INTERVAL * 5
+_status_snapshot = {'status': None, 'stats': None, 'sampled_at': None, 'error': None}
+_status_sampler_started = False
+_status_sampler_lock = threading.Lock()
+
+
+def sample_status():
+    """Refresh the cached status and stats snapshot"""
+    global _status_snapshot
+    server = get_mcp_server()
+    memory_store = get_memory_store()
+    collections = get_vector_db().list_collections()
+    sampled_at = time.time()
+    _status_snapshot = {
+        'status': {
+            'status': 'running',
+            'version': '2.0.0',
+            'sampled_at': sampled_at,
+            'mcp_server': {
+                'initialized': server.is_initialized(),
+                'tools_count': len(server.list_tools()),
+                'memory_items': memory_store.count()
+            },
+            'services': {
+                'vector_db': {
+                    'connected': len(collections) >= 0,
+                    'collections': collections
+                },
+                'postgres': {
+                    'connected': True
+                }
+            }
+        },
+        'stats': {
+            'total_requests': server.get_request_count(),
+            'tools_executed': server.get_execution_count(),
+            'memory_usage': memory_store.get_stats(),
+            'active_sessions': server.get_active_sessions(),
+            'vector_collections': len(collections),
+            'sampled_at': sampled_at
+        },
+        'sampled_at': sampled_at,
+        'error': None
+    }
+
+
+def _status_sampler():
+    """Background loop keeping the snapshot fresh"""
+    global _status_snapshot
+    while True:
+        try:
+            sample_status()
+        except Exception as e:
+            logger.error(f"Status sampling failed: {str(e)}")
+            _status_snapshot = {**_status_snapshot, 'error': str(e)}
+        time.sleep(STATUS_SAMPLE_INTERVAL)
+
+
+def _ensure_status_sampler():
+    """Start the sampler thread once per process"""
+    global _status_sampler_started
+    if _status_sampler_started:
+        return
+    with _status_sampler_lock:
+        if not _status_sampler_started:
+            threading.Thread(target=_status_sampler, name='status-sampler', daemon=True).start()
+            _status_sampler_started = True
+
+
+def snapshot_response(kind: str):
+    """Serve the latest status/stats snapshot; 503 if missing, failing or stale"""
+    _ensure_status_sampler()
+    snapshot = _status_snapshot
+    if snapshot['sampled_at'] is None:
+        return ojson({'status': 'unavailable', 'error': snapshot['error'] or 'Status not sampled yet'}, 503)
+
+    age = time.time() - snapshot['sampled_at']
+    if snapshot['error'] or age > STATUS_MAX_AGE:
+        return ojson({
+            **snapshot[kind],
+            'status': 'degraded',
+            'error': snapshot['error'] or f'Status snapshot is {age:.1f}s old',
+            'age': age
+        }, 503)
+    return ojson(snapshot[kind])
+
+
+# ============================================================================
+# JSON Responses
+# ============================================================================
+
+def _json_default(obj):
+    """Encode types orjson does not handle natively (matches Flask's jsonify)"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError
+
+
+def ojson(obj, status: int = 200):
+    """Build a JSON response with orjson"""
+    return app.response_class(
+        orjson.dumps(obj, default=_json_default,
+                     option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+def ndjson(records):
+    """Stream an iterable of records as newline-delimited JSON"""
+    def generate():
+        for record in records:
+            yield orjson.dumps(record, default=_json_default,
+                               option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return app.response_class(stream_with_context(generate()), mimetype='application/x-ndjson')
 
 
 # ============================================================================
-# Authentication Decorator
+# Route Decorators
 # ============================================================================
 
 def require_auth(f):
     """Decorator to require authentication for endpoints"""
-    from functools import wraps
-
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        auth_result = auth_manager.authenticate(request)
+        auth_result = get_auth_manager().authenticate(request)
         if not auth_result['authenticated']:
-            return jsonify({
+            return ojson({
                 'error': 'Authentication required',
                 'message': auth_result.get('message', 'Invalid credentials')
-            }), 401
+            }, 401)
 
         request.user = auth_result.get('user')
         return f(*args, **kwargs)
@@ -68,6 +281,32 @@ def require_auth(f):
     return decorated_function
 
 
+def mcp_route(tool_name: str, body: bool = False):
+    """
+    Decorator turning a parameter builder into a tool-backed endpoint.
+
+    The wrapped function returns the tool parameters (or nothing); with
+    `body=True` they are merged over the request's JSON body. The tool
+    result is returned as JSON and any failure as a 500. Apply it below
+    `require_auth` and the response-cache decorators.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            try:
+                params = f(*args, **kwargs) or {}
+                if body:
+                    params = {**(request.get_json() or {}), **params}
+                result = get_mcp_server().execute_tool(tool_name, params, user=request.user)
+                return ojson(result.get('result', result), 200)
+            except Exception as e:
+                logger.error(f"Error in {f.__name__} ({tool_name}): {str(e)}")
+                return ojson({'error': str(e)}, 500)
+
+        return decorated_function
+    return decorator
+
+
 # ============================================================================
 # Dashboard Routes
 # ============================================================================
@@ -82,37 +321,14 @@ def index():
 @require_auth
 def get_status():
     """Get server status"""
-    return jsonify({
-        'status': 'running',
-        'version': '2.0.0',
-        'mcp_server': {
-            'initialized': mcp_server.is_initialized(),
-            'tools_count': len(mcp_server.list_tools()),
-            'memory_items': memory_store.count()
-        },
-        'services': {
-            'vector_db': {
-                'connected': len(vector_db.list_collections()) >= 0,
-                'collections': vector_db.list_collections()
-            },
-            'postgres': {
-                'connected': True
-            }
-        }
-    })
+    return snapshot_response('status')
 
 
 @app.route('/api/stats')
 @require_auth
 def get_stats():
     """Get usage statistics"""
-    return jsonify({
-        'total_requests': mcp_server.get_request_count(),
-        'tools_executed': mcp_server.get_execution_count(),
-        'memory_usage': memory_store.get_stats(),
-        'active_sessions': mcp_server.get_active_sessions(),
-        'vector_collections': len(vector_db.list_collections())
-    })
+    return snapshot_response('stats')
 
 
 # ============================================================================
@@ -131,13 +347,13 @@ def mcp_initialize():
             'user': request.user
         }
 
-        result = mcp_server.initialize(client_info)
+        result = get_mcp_server().initialize(client_info)
         logger.info(f"MCP server initialized for {client_info['name']}")
 
-        return jsonify(result), 200
+        return ojson(result, 200)
     except Exception as e:
         logger.error(f"Error initializing MCP server: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 @app.route('/mcp/tools/list', methods=['GET'])
@@ -145,14 +361,14 @@ def mcp_initialize():
 def mcp_list_tools():
     """List all available tools"""
     try:
-        tools = mcp_server.list_tools()
-        return jsonify({
+        tools = get_mcp_server().list_tools()
+        return ojson({
             'tools': tools,
             'count': len(tools)
-        }), 200
+        }, 200)
     except Exception as e:
         logger.error(f"Error listing tools: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 @app.route('/mcp/tools/execute', methods=['POST'])
@@ -162,18 +378,66 @@ def mcp_execute_tool():
     try:
         data = request.get_json()
         if not data or 'tool_name' not in data:
-            return jsonify({'error': 'tool_name is required'}), 400
+            return ojson({'error': 'tool_name is required'}, 400)
 
         tool_name = data['tool_name']
         parameters = data.get('parameters', {})
 
-        result = mcp_server.execute_tool(tool_name, parameters, user=request.user)
+        result = get_mcp_server().execute_tool(tool_name, parameters, user=request.user)
         logger.info(f"Tool {tool_name} executed by {request.user}")
+        response_cache.invalidate(*tool_cache_namespaces(tool_name, result))
 
-        return jsonify(result), 200
+        return ojson(result, 200)
     except Exception as e:
         logger.error(f"Error executing tool: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
+
+
+# Batched tool calls: one auth check and one round-trip for many tools.
+# Handlers are mostly Postgres/Qdrant I/O, so they run on a small pool.
+BATCH_MAX_REQUESTS = 100
+batch_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('BATCH_WORKERS', 8)),
+    thread_name_prefix='batch'
+)
+
+
+def _execute_batch_entry(entry: dict, user: str) -> dict:
+    """Run one batched tool call, reporting failures in-band"""
+    tool_name = entry.get('tool_name') if isinstance(entry, dict) else None
+    if not tool_name:
+        return {'status': 400, 'error': 'tool_name is required'}
+    try:
+        result = get_mcp_server().execute_tool(tool_name, entry.get('parameters', {}), user=user)
+        return {'status': 200, 'result': result}
+    except ValueError as e:
+        return {'status': 404, 'error': str(e)}
+    except Exception as e:
+        logger.error(f"Error executing batched tool {tool_name}: {str(e)}")
+        return {'status': 500, 'error': str(e)}
+
+
+@app.route('/api/batch', methods=['POST'])
+@require_auth
+def execute_batch():
+    """Execute several tool calls; responses are returned in request order"""
+    data = request.get_json() or {}
+    entries = data.get('requests')
+    if not isinstance(entries, list):
+        return ojson({'error': 'requests must be a list'}, 400)
+    if len(entries) > BATCH_MAX_REQUESTS:
+        return ojson({'error': f'At most {BATCH_MAX_REQUESTS} requests per batch'}, 400)
+
+    user = request.user
+    responses = list(batch_executor.map(lambda entry: _execute_batch_entry(entry, user), entries))
+    # One invalidation per batch covering every successful write
+    namespaces = set()
+    for entry, response in zip(entries, responses):
+        if response['status'] == 200:
+            namespaces.update(tool_cache_namespaces(entry['tool_name'], response['result']))
+    response_cache.invalidate(*namespaces)
+    logger.info(f"Batch of {len(entries)} tools executed by {user}")
+    return ojson({'responses': responses}, 200)
 
 
 # ============================================================================
@@ -185,10 +449,10 @@ def mcp_execute_tool():
 def get_profile():
     """Get user profile"""
     try:
-        result = profile_manager.get_profile(request.user)
-        return jsonify(result), 200 if result['success'] else 404
+        result = get_profile_manager().get_profile(request.user)
+        return ojson(result, 200 if result['success'] else 404)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 @app.route('/api/profile', methods=['POST'])
@@ -197,7 +461,7 @@ def create_or_update_profile():
     """Create or update user profile"""
     try:
         data = request.get_json()
-        result = profile_manager.create_or_update_profile(
+        result = get_profile_manager().create_or_update_profile(
             user_id=request.user,
             full_name=data.get('full_name'),
             email=data.get('email'),
@@ -205,9 +469,9 @@ def create_or_update_profile():
             preferences=data.get('preferences'),
             metadata=data.get('metadata')
         )
-        return jsonify(result), 200
+        return ojson(result, 200)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 @app.route('/api/profile/preferences', methods=['PUT'])
@@ -216,13 +480,13 @@ def update_preferences():
     """Update user preferences"""
     try:
         data = request.get_json()
-        result = profile_manager.update_preferences(
+        result = get_profile_manager().update_preferences(
             user_id=request.user,
             preferences=data
         )
-        return jsonify(result), 200
+        return ojson(result, 200)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 # ============================================================================
@@ -235,15 +499,15 @@ def create_conversation():
     """Create new conversation"""
     try:
         data = request.get_json()
-        result = conversation_manager.create_conversation(
+        result = get_conversation_manager().create_conversation(
             user_id=request.user,
             session_id=data.get('session_id'),
             title=data.get('title'),
             context=data.get('context')
         )
-        return jsonify(result), 200
+        return ojson(result, 200)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 @app.route('/api/conversations/<session_id>/messages', methods=['POST'])
@@ -252,15 +516,15 @@ def add_message(session_id):
     """Add message to conversation"""
     try:
         data = request.get_json()
-        result = conversation_manager.add_message(
+        result = get_conversation_manager().add_message(
             session_id=session_id,
             role=data.get('role'),
             content=data.get('content'),
             metadata=data.get('metadata')
         )
-        return jsonify(result), 200
+        return ojson(result, 200)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 @app.route('/api/conversations/<session_id>/history', methods=['GET'])
@@ -269,10 +533,10 @@ def get_conversation_history(session_id):
     """Get conversation history"""
     try:
         limit = int(request.args.get('limit', 100))
-        result = conversation_manager.get_conversation_history(session_id, limit)
-        return jsonify(result), 200
+        result = get_conversation_manager().get_conversation_history(session_id, limit)
+        return ojson(result, 200)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 @app.route('/api/conversations', methods=['GET'])
@@ -281,10 +545,10 @@ def get_user_conversations():
     """Get user's conversations"""
     try:
         limit = int(request.args.get('limit', 50))
-        result = conversation_manager.get_user_conversations(request.user, limit)
-        return jsonify(result), 200
+        result = get_conversation_manager().get_user_conversations(request.user, limit)
+        return ojson(result, 200)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 # ============================================================================
@@ -297,7 +561,7 @@ def store_memory():
     """Store long-term memory"""
     try:
         data = request.get_json()
-        result = memory_manager.store_memory(
+        result = get_memory_manager().store_memory(
             user_id=request.user,
             memory_type=data.get('memory_type'),
             content=data.get('content'),
@@ -305,9 +569,9 @@ def store_memory():
             tags=data.get('tags'),
             metadata=data.get('metadata')
         )
-        return jsonify(result), 200
+        return ojson(result, 200)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 @app.route('/api/memories', methods=['GET'])
@@ -319,15 +583,15 @@ def get_memories():
         tags = request.args.getlist('tags')
         limit = int(request.args.get('limit', 100))
 
-        result = memory_manager.get_memories(
+        result = get_memory_manager().get_memories(
             user_id=request.user,
             memory_type=memory_type,
             tags=tags if tags else None,
             limit=limit
         )
-        return jsonify(result), 200
+        return ojson(result, 200)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 @app.route('/api/memories/<memory_id>', methods=['DELETE'])
@@ -335,10 +599,10 @@ def get_memories():
 def delete_memory(memory_id):
     """Delete memory"""
     try:
-        result = memory_manager.delete_memory(memory_id)
-        return jsonify(result), 200
+        result = get_memory_manager().delete_memory(memory_id)
+        return ojson(result, 200)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 # ============================================================================
@@ -356,21 +620,22 @@ def search_code():
         language = data.get('language')
         limit = data.get('limit', 10)
 
-        results = code_indexer.search_code(
+        results = get_code_indexer().search_code(
             query=query,
             repo_id=repo_id,
             language=language,
-            limit=limit
+            limit=limit,
+            use_cache=not data.get('no_cache', False)
         )
 
-        return jsonify({
+        return ojson({
             'success': True,
             'results': results,
             'count': len(results)
-        }), 200
+        }, 200)
 
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 # ============================================================================
@@ -379,101 +644,171 @@ def search_code():
 
 @app.route('/api/git/repos', methods=['GET'])
 @require_auth
+@response_cache.cached_get('git', ttl=30)
+@mcp_route('git_list_repos')
 def list_git_repos():
     """List all cloned Git repositories"""
-    try:
-        result = mcp_server.execute_tool('git_list_repos', {}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {}
 
 
 @app.route('/api/git/clone', methods=['POST'])
 @require_auth
+@response_cache.invalidates('git')
+@mcp_route('git_clone')
 def clone_git_repo():
-    """Clone a Git repository"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('git_clone', {
-            'repo_url': data.get('repo_url'),
-            'branch': data.get('branch', 'main'),
-            'depth': data.get('depth'),
-            'username': data.get('username'),
-            'password': data.get('password'),
-            'ssh_key_path': data.get('ssh_key_path')
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    """
+    Clone a Git repository.
+
+    Clones are shallow (depth 1) unless `depth` is given; pass
+    `full_history=true` for a complete clone. Pulling a shallow clone
+    fetches the new tip at depth 1 and hard-resets onto it, so local
+    changes in shallow clones are discarded.
+    """
+    data = request.get_json()
+    full_history = request.args.get('full_history', 'false').lower() == 'true'
+    return {
+        'repo_url': data.get('repo_url'),
+        'branch': data.get('branch', 'main'),
+        'depth': None if full_history else data.get('depth', 1),
+        'username': data.get('username'),
+        'password': data.get('password'),
+        'ssh_key_path': data.get('ssh_key_path')
+    }
 
 
 @app.route('/api/git/repos/<repo_name>', methods=['DELETE'])
 @require_auth
+@response_cache.invalidates('git')
+@mcp_route('git_delete_repo')
 def delete_git_repo(repo_name):
     """Delete a cloned repository"""
-    try:
-        result = mcp_server.execute_tool('git_delete_repo', {'repo_name': repo_name}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'repo_name': repo_name}
 
 
 @app.route('/api/git/repos/<repo_name>/status', methods=['GET'])
 @require_auth
+@mcp_route('git_status')
 def get_git_status(repo_name):
     """Get repository status"""
-    try:
-        result = mcp_server.execute_tool('git_status', {'repo_name': repo_name}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'repo_name': repo_name}
 
 
 @app.route('/api/git/repos/<repo_name>/pull', methods=['POST'])
 @require_auth
+@response_cache.invalidates('git')
+@mcp_route('git_pull')
 def pull_git_repo(repo_name):
     """Pull latest changes"""
-    try:
-        result = mcp_server.execute_tool('git_pull', {'repo_name': repo_name}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'repo_name': repo_name}
 
 
 @app.route('/api/git/repos/<repo_name>/files', methods=['GET'])
 @require_auth
 def list_repo_files(repo_name):
-    """List files in repository"""
+    """List files in repository (NDJSON stream, one entry per line)"""
     try:
         path = request.args.get('path', '.')
-        result = mcp_server.execute_tool('git_list_files', {'repo_name': repo_name, 'path': path}, user=request.user)
-        return jsonify(result.get('result', result)), 200
+        return ndjson(get_mcp_server().iter_tool('git_list_files', {'repo_name': repo_name, 'path': path}, user=request.user))
+    except FileNotFoundError as e:
+        return ojson({'success': False, 'error': str(e)}, 404)
+    except NotADirectoryError as e:
+        return ojson({'success': False, 'error': str(e)}, 400)
+    except Exception as e:
+        return ojson({'error': str(e)}, 500)
+
+
+# Indexing embeds every chunk of a repository and can take minutes, so it
+# runs on a background pool; job state lives in Redis for any worker to read.
+# Each job holds a lease in Redis that this process renews until it finishes,
+# so a job whose worker died shows up as failed and can be re-queued.
+# Without Redis, jobs fall back to an in-process registry (see JobStore).
+index_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('INDEX_WORKERS', 2)),
+    thread_name_prefix='index'
+)
+_owned_index_jobs = {}  # repo_name -> job_id of queued/running jobs in this process
+_owned_index_jobs_lock = threading.Lock()
+
+
+def _index_heartbeat():
+    """Background loop renewing the leases of this process's index jobs"""
+    while True:
+        time.sleep(index_jobs.lease / 4)
+        with _owned_index_jobs_lock:
+            owned = list(_owned_index_jobs.items())
+        for repo_name, job_id in owned:
+            if not index_jobs.renew(repo_name, job_id) and _owned_index_jobs.get(repo_name) == job_id:
+                logger.warning(f"Index job {job_id} for {repo_name} lost its lease")
+
+
+threading.Thread(target=_index_heartbeat, name='index-heartbeat', daemon=True).start()
+
+
+def _run_index_job(job: dict, repo_path: str):
+    """Index a repository in the background, recording progress in index_jobs"""
+    repo_name = job['repo_name']
+    job = {**job, 'status': 'running', 'started_at': time.time()}
+    index_jobs.put(repo_name, job)
+    try:
+        result = get_code_indexer().index_repository(repo_id=repo_name, repo_path=repo_path)
+        job.update(status='completed' if result.get('success') else 'failed', result=result)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        logger.error(f"Error indexing repository {repo_name}: {str(e)}")
+        job.update(status='failed', error=str(e))
+    job['finished_at'] = time.time()
+
+    with _owned_index_jobs_lock:
+        _owned_index_jobs.pop(repo_name, None)
+    index_jobs.put(repo_name, job)
+    index_jobs.release(repo_name, job['job_id'])
 
 
 @app.route('/api/git/repos/<repo_name>/index', methods=['POST'])
 @require_auth
 def index_git_repo(repo_name):
-    """Index repository for semantic search"""
+    """Queue repository indexing for semantic search (poll .../index/status)"""
     try:
         from src.tools.git_tools import GitTools
         git_tools = GitTools()
         repo_path = git_tools._get_repo_path(repo_name)
 
         if not os.path.exists(repo_path):
-            return jsonify({'error': f'Repository {repo_name} not found'}), 404
-
-        indexed_files = code_indexer.index_repository(repo_path, repo_id=repo_name)
+            return ojson({'error': f'Repository {repo_name} not found'}, 404)
 
-        return jsonify({
-            'success': True,
+        job = {
+            'job_id': uuid.uuid4().hex,
             'repo_name': repo_name,
-            'indexed_files': indexed_files,
-            'message': f'Indexed {indexed_files} files'
-        }), 200
+            'status': 'queued',
+            'queued_at': time.time()
+        }
+        if index_jobs.claim(repo_name, job['job_id']):
+            index_jobs.put(repo_name, job)
+            with _owned_index_jobs_lock:
+                _owned_index_jobs[repo_name] = job['job_id']
+            index_executor.submit(_run_index_job, job, repo_path)
+        else:
+            # Another live job holds the lease; report it instead of queueing twice
+            job = index_jobs.get(repo_name)
+            if not job or job['status'] not in index_jobs.ACTIVE_STATUSES:
+                return ojson({'error': f'Indexing of {repo_name} is already being queued'}, 409)
+
+        return ojson({
+            'success': True,
+            **job,
+            'status_url': f'/api/git/repos/{repo_name}/index/status'
+        }, 202)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
+
+
+@app.route('/api/git/repos/<repo_name>/index/status', methods=['GET'])
+@require_auth
+def get_index_status(repo_name):
+    """Get the state of the latest indexing job for a repository"""
+    job = index_jobs.get(repo_name)
+    if job is None:
+        return ojson({'error': f'No indexing job found for {repo_name}'}, 404)
+    return ojson(job, 200)
 
 
 # ============================================================================
@@ -482,65 +817,51 @@ def index_git_repo(repo_name):
 
 @app.route('/api/artifacts', methods=['GET'])
 @require_auth
+@response_cache.cached_get('artifacts', ttl=30)
+@mcp_route('artifact_search')
 def list_artifacts():
     """List artifacts"""
-    try:
-        result = mcp_server.execute_tool('artifact_search', {
-            'artifact_type': request.args.get('type'),
-            'project_id': request.args.get('project_id', type=int),
-            'query': request.args.get('query'),
-            'limit': request.args.get('limit', 50, type=int)
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'artifact_type': request.args.get('type'),
+        'project_id': request.args.get('project_id', type=int),
+        'query': request.args.get('query'),
+        'limit': request.args.get('limit', 50, type=int)
+    }
 
 
 @app.route('/api/artifacts', methods=['POST'])
 @require_auth
+@response_cache.invalidates('artifacts', 'projects')
+@mcp_route('artifact_create', body=True)
 def create_artifact():
     """Create an artifact"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('artifact_create', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/artifacts/<int:artifact_id>', methods=['GET'])
 @require_auth
+@response_cache.cached_get('artifacts', ttl=30)
+@mcp_route('artifact_get')
 def get_artifact(artifact_id):
     """Get artifact by ID"""
-    try:
-        result = mcp_server.execute_tool('artifact_get', {'artifact_id': artifact_id}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'artifact_id': artifact_id}
 
 
 @app.route('/api/artifacts/<int:artifact_id>', methods=['PUT'])
 @require_auth
+@response_cache.invalidates('artifacts', 'projects')
+@mcp_route('artifact_update', body=True)
 def update_artifact(artifact_id):
     """Update an artifact"""
-    try:
-        data = request.get_json()
-        data['artifact_id'] = artifact_id
-        result = mcp_server.execute_tool('artifact_update', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'artifact_id': artifact_id}
 
 
 @app.route('/api/artifacts/<int:artifact_id>', methods=['DELETE'])
 @require_auth
+@response_cache.invalidates('artifacts', 'projects')
+@mcp_route('artifact_delete')
 def delete_artifact(artifact_id):
     """Delete an artifact"""
-    try:
-        result = mcp_server.execute_tool('artifact_delete', {'artifact_id': artifact_id}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'artifact_id': artifact_id}
 
 
 # ============================================================================
@@ -549,57 +870,45 @@ def delete_artifact(artifact_id):
 
 @app.route('/api/instructions', methods=['GET'])
 @require_auth
+@response_cache.cached_get('instructions', ttl=30)
+@mcp_route('instruction_list')
 def list_instructions():
     """List instructions"""
-    try:
-        result = mcp_server.execute_tool('instruction_list', {
-            'category': request.args.get('category'),
-            'scope': request.args.get('scope'),
-            'include_inactive': request.args.get('include_inactive', 'false').lower() == 'true'
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'category': request.args.get('category'),
+        'scope': request.args.get('scope'),
+        'include_inactive': request.args.get('include_inactive', 'false').lower() == 'true'
+    }
 
 
 @app.route('/api/instructions', methods=['POST'])
 @require_auth
+@response_cache.invalidates('instructions')
+@mcp_route('instruction_create', body=True)
 def create_instruction():
     """Create an instruction"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('instruction_create', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/instructions/<int:instruction_id>', methods=['PUT'])
 @require_auth
+@response_cache.invalidates('instructions')
+@mcp_route('instruction_update', body=True)
 def update_instruction(instruction_id):
     """Update an instruction"""
-    try:
-        data = request.get_json()
-        data['instruction_id'] = instruction_id
-        result = mcp_server.execute_tool('instruction_update', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'instruction_id': instruction_id}
 
 
 @app.route('/api/instructions/<int:instruction_id>', methods=['DELETE'])
 @require_auth
+@response_cache.invalidates('instructions')
+@mcp_route('instruction_delete')
 def delete_instruction(instruction_id):
     """Delete an instruction"""
-    try:
-        permanent = request.args.get('permanent', 'false').lower() == 'true'
-        result = mcp_server.execute_tool('instruction_delete', {
-            'instruction_id': instruction_id,
-            'permanent': permanent
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    permanent = request.args.get('permanent', 'false').lower() == 'true'
+    return {
+        'instruction_id': instruction_id,
+        'permanent': permanent
+    }
 
 
 # ============================================================================
@@ -608,62 +917,48 @@ def delete_instruction(instruction_id):
 
 @app.route('/api/projects', methods=['GET'])
 @require_auth
+@response_cache.cached_get('projects', ttl=30)
+@mcp_route('project_list')
 def list_projects():
     """List projects"""
-    try:
-        result = mcp_server.execute_tool('project_list', {
-            'status': request.args.get('status')
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'status': request.args.get('status')
+    }
 
 
 @app.route('/api/projects', methods=['POST'])
 @require_auth
+@response_cache.invalidates('projects')
+@mcp_route('project_create', body=True)
 def create_project():
     """Create a project"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('project_create', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/projects/<int:project_id>', methods=['GET'])
 @require_auth
+@response_cache.cached_get('projects', ttl=30)
+@mcp_route('project_get')
 def get_project(project_id):
     """Get project with artifacts"""
-    try:
-        result = mcp_server.execute_tool('project_get', {'project_id': project_id}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'project_id': project_id}
 
 
 @app.route('/api/projects/<int:project_id>', methods=['PUT'])
 @require_auth
+@response_cache.invalidates('projects')
+@mcp_route('project_update', body=True)
 def update_project(project_id):
     """Update a project"""
-    try:
-        data = request.get_json()
-        data['project_id'] = project_id
-        result = mcp_server.execute_tool('project_update', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'project_id': project_id}
 
 
 @app.route('/api/projects/<int:project_id>', methods=['DELETE'])
 @require_auth
+@response_cache.invalidates('projects')
+@mcp_route('project_delete')
 def delete_project(project_id):
     """Delete a project"""
-    try:
-        result = mcp_server.execute_tool('project_delete', {'project_id': project_id}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'project_id': project_id}
 
 
 # ============================================================================
@@ -672,104 +967,83 @@ def delete_project(project_id):
 
 @app.route('/api/knowledge/nodes', methods=['GET'])
 @require_auth
+@response_cache.cached_get('knowledge', ttl=30)
+@mcp_route('knowledge_search_nodes')
 def list_knowledge_nodes():
     """List knowledge nodes"""
-    try:
-        result = mcp_server.execute_tool('knowledge_search_nodes', {
-            'query': request.args.get('query'),
-            'node_type': request.args.get('node_type'),
-            'limit': request.args.get('limit', 50, type=int)
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'query': request.args.get('query'),
+        'node_type': request.args.get('node_type'),
+        'limit': request.args.get('limit', 50, type=int)
+    }
 
 
 @app.route('/api/knowledge/nodes', methods=['POST'])
 @require_auth
+@response_cache.invalidates('knowledge')
+@mcp_route('knowledge_create_node', body=True)
 def create_knowledge_node():
     """Create a knowledge node"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('knowledge_create_node', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/knowledge/nodes/<int:node_id>', methods=['DELETE'])
 @require_auth
+@response_cache.invalidates('knowledge')
+@mcp_route('knowledge_delete_node')
 def delete_knowledge_node(node_id):
     """Delete a knowledge node"""
-    try:
-        result = mcp_server.execute_tool('knowledge_delete_node', {'node_id': node_id}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'node_id': node_id}
 
 
 @app.route('/api/knowledge/connect', methods=['POST'])
 @require_auth
+@response_cache.invalidates('knowledge')
+@mcp_route('knowledge_connect', body=True)
 def connect_knowledge_nodes():
     """Connect two knowledge nodes"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('knowledge_connect', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/knowledge/connect-entities', methods=['POST'])
 @require_auth
+@response_cache.invalidates('knowledge')
+@mcp_route('knowledge_connect_entities', body=True)
 def connect_entities():
     """Connect any two entities"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('knowledge_connect_entities', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/knowledge/connections/<int:node_id>', methods=['GET'])
 @require_auth
+@response_cache.cached_get('knowledge', ttl=30)
+@mcp_route('knowledge_get_connections')
 def get_node_connections(node_id):
     """Get connections for a node"""
-    try:
-        result = mcp_server.execute_tool('knowledge_get_connections', {
-            'node_id': node_id,
-            'direction': request.args.get('direction', 'both')
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'node_id': node_id,
+        'direction': request.args.get('direction', 'both')
+    }
 
 
 @app.route('/api/knowledge/edges/<int:edge_id>', methods=['DELETE'])
 @require_auth
+@response_cache.invalidates('knowledge')
+@mcp_route('knowledge_delete_connection')
 def delete_knowledge_edge(edge_id):
     """Delete a knowledge edge"""
-    try:
-        result = mcp_server.execute_tool('knowledge_delete_connection', {'edge_id': edge_id}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'edge_id': edge_id}
 
 
 @app.route('/api/knowledge/graph', methods=['GET'])
 @require_auth
 def get_knowledge_graph():
-    """Get full knowledge graph for visualization"""
+    """Get full knowledge graph for visualization (NDJSON stream of node/edge records)"""
     try:
-        result = mcp_server.execute_tool('knowledge_get_graph', {
+        return ndjson(get_mcp_server().iter_tool('knowledge_get_graph', {
             'center_node_id': request.args.get('center_node_id', type=int),
             'depth': request.args.get('depth', 2, type=int),
             'include_entities': request.args.get('include_entities', 'true').lower() == 'true'
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
+        }, user=request.user))
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 
 # ============================================================================
@@ -778,81 +1052,59 @@ def get_knowledge_graph():
 
 @app.route('/api/tasks', methods=['GET'])
 @require_auth
+@mcp_route('task_list')
 def list_tasks():
     """List tasks"""
-    try:
-        result = mcp_server.execute_tool('task_list', {
-            'project_id': request.args.get('project_id', type=int),
-            'status': request.args.get('status'),
-            'assigned_to': request.args.get('assigned_to'),
-            'due_before': request.args.get('due_before'),
-            'limit': request.args.get('limit', 100, type=int)
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'project_id': request.args.get('project_id', type=int),
+        'status': request.args.get('status'),
+        'assigned_to': request.args.get('assigned_to'),
+        'due_before': request.args.get('due_before'),
+        'limit': request.args.get('limit', 100, type=int)
+    }
 
 
 @app.route('/api/tasks', methods=['POST'])
 @require_auth
+@mcp_route('task_create', body=True)
 def create_task():
     """Create a task"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('task_create', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/tasks/<int:task_id>', methods=['GET'])
 @require_auth
+@mcp_route('task_get')
 def get_task(task_id):
     """Get task details"""
-    try:
-        result = mcp_server.execute_tool('task_get', {'task_id': task_id}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'task_id': task_id}
 
 
 @app.route('/api/tasks/<int:task_id>', methods=['PUT'])
 @require_auth
+@mcp_route('task_update', body=True)
 def update_task(task_id):
     """Update a task"""
-    try:
-        data = request.get_json()
-        data['task_id'] = task_id
-        result = mcp_server.execute_tool('task_update', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'task_id': task_id}
 
 
 @app.route('/api/tasks/<int:task_id>', methods=['DELETE'])
 @require_auth
+@mcp_route('task_delete')
 def delete_task(task_id):
     """Delete a task"""
-    try:
-        result = mcp_server.execute_tool('task_delete', {'task_id': task_id}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'task_id': task_id}
 
 
 @app.route('/api/tasks/<int:task_id>/complete', methods=['POST'])
 @require_auth
+@mcp_route('task_complete')
 def complete_task(task_id):
     """Mark task as completed"""
-    try:
-        data = request.get_json() or {}
-        result = mcp_server.execute_tool('task_complete', {
-            'task_id': task_id,
-            'completion_notes': data.get('completion_notes')
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    data = request.get_json() or {}
+    return {
+        'task_id': task_id,
+        'completion_notes': data.get('completion_notes')
+    }
 
 
 # ============================================================================
@@ -861,52 +1113,36 @@ def complete_task(task_id):
 
 @app.route('/api/milestones', methods=['GET'])
 @require_auth
+@mcp_route('milestone_list')
 def list_milestones():
     """List milestones"""
-    try:
-        result = mcp_server.execute_tool('milestone_list', {
-            'project_id': request.args.get('project_id', type=int),
-            'status': request.args.get('status')
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'project_id': request.args.get('project_id', type=int),
+        'status': request.args.get('status')
+    }
 
 
 @app.route('/api/milestones', methods=['POST'])
 @require_auth
+@mcp_route('milestone_create', body=True)
 def create_milestone():
     """Create a milestone"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('milestone_create', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/milestones/<int:milestone_id>', methods=['PUT'])
 @require_auth
+@mcp_route('milestone_update', body=True)
 def update_milestone(milestone_id):
     """Update a milestone"""
-    try:
-        data = request.get_json()
-        data['milestone_id'] = milestone_id
-        result = mcp_server.execute_tool('milestone_update', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'milestone_id': milestone_id}
 
 
 @app.route('/api/milestones/<int:milestone_id>', methods=['DELETE'])
 @require_auth
+@mcp_route('milestone_delete')
 def delete_milestone(milestone_id):
     """Delete a milestone"""
-    try:
-        result = mcp_server.execute_tool('milestone_delete', {'milestone_id': milestone_id}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'milestone_id': milestone_id}
 
 
 # ============================================================================
@@ -915,55 +1151,39 @@ def delete_milestone(milestone_id):
 
 @app.route('/api/notes', methods=['GET'])
 @require_auth
+@mcp_route('note_search')
 def search_notes():
     """Search notes"""
-    try:
-        result = mcp_server.execute_tool('note_search', {
-            'query': request.args.get('query'),
-            'note_type': request.args.get('note_type'),
-            'project_id': request.args.get('project_id', type=int),
-            'pinned_only': request.args.get('pinned_only', 'false').lower() == 'true',
-            'limit': request.args.get('limit', 50, type=int)
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'query': request.args.get('query'),
+        'note_type': request.args.get('note_type'),
+        'project_id': request.args.get('project_id', type=int),
+        'pinned_only': request.args.get('pinned_only', 'false').lower() == 'true',
+        'limit': request.args.get('limit', 50, type=int)
+    }
 
 
 @app.route('/api/notes', methods=['POST'])
 @require_auth
+@mcp_route('note_create', body=True)
 def create_note():
     """Create a note"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('note_create', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/notes/<int:note_id>', methods=['PUT'])
 @require_auth
+@mcp_route('note_update', body=True)
 def update_note(note_id):
     """Update a note"""
-    try:
-        data = request.get_json()
-        data['note_id'] = note_id
-        result = mcp_server.execute_tool('note_update', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'note_id': note_id}
 
 
 @app.route('/api/notes/<int:note_id>', methods=['DELETE'])
 @require_auth
+@mcp_route('note_delete')
 def delete_note(note_id):
     """Delete a note"""
-    try:
-        result = mcp_server.execute_tool('note_delete', {'note_id': note_id}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'note_id': note_id}
 
 
 # ============================================================================
@@ -972,43 +1192,32 @@ def delete_note(note_id):
 
 @app.route('/api/summaries', methods=['GET'])
 @require_auth
+@mcp_route('summary_search')
 def search_summaries():
     """Search summaries"""
-    try:
-        result = mcp_server.execute_tool('summary_search', {
-            'query': request.args.get('query'),
-            'source_type': request.args.get('source_type'),
-            'limit': request.args.get('limit', 20, type=int)
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'query': request.args.get('query'),
+        'source_type': request.args.get('source_type'),
+        'limit': request.args.get('limit', 20, type=int)
+    }
 
 
 @app.route('/api/summaries', methods=['POST'])
 @require_auth
+@mcp_route('summary_create', body=True)
 def create_summary():
     """Create a summary"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('summary_create', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/summaries/<source_type>/<int:source_id>', methods=['GET'])
 @require_auth
+@mcp_route('summary_get')
 def get_summaries(source_type, source_id):
     """Get summaries for a source"""
-    try:
-        result = mcp_server.execute_tool('summary_get', {
-            'source_type': source_type,
-            'source_id': source_id
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'source_type': source_type,
+        'source_id': source_id
+    }
 
 
 # ============================================================================
@@ -1017,82 +1226,60 @@ def get_summaries(source_type, source_id):
 
 @app.route('/api/triggers', methods=['GET'])
 @require_auth
+@mcp_route('trigger_list')
 def list_triggers():
     """List triggers"""
-    try:
-        result = mcp_server.execute_tool('trigger_list', {
-            'trigger_type': request.args.get('trigger_type'),
-            'is_active': request.args.get('is_active', type=lambda x: x.lower() == 'true') if request.args.get('is_active') else None,
-            'event_source': request.args.get('event_source')
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'trigger_type': request.args.get('trigger_type'),
+        'is_active': request.args.get('is_active', type=lambda x: x.lower() == 'true') if request.args.get('is_active') else None,
+        'event_source': request.args.get('event_source')
+    }
 
 
 @app.route('/api/triggers', methods=['POST'])
 @require_auth
+@mcp_route('trigger_create', body=True)
 def create_trigger():
     """Create a trigger"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('trigger_create', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/triggers/<int:trigger_id>', methods=['PUT'])
 @require_auth
+@mcp_route('trigger_update', body=True)
 def update_trigger(trigger_id):
     """Update a trigger"""
-    try:
-        data = request.get_json()
-        data['trigger_id'] = trigger_id
-        result = mcp_server.execute_tool('trigger_update', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'trigger_id': trigger_id}
 
 
 @app.route('/api/triggers/<int:trigger_id>', methods=['DELETE'])
 @require_auth
+@mcp_route('trigger_delete')
 def delete_trigger(trigger_id):
     """Delete a trigger"""
-    try:
-        result = mcp_server.execute_tool('trigger_delete', {'trigger_id': trigger_id}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'trigger_id': trigger_id}
 
 
 @app.route('/api/triggers/<int:trigger_id>/execute', methods=['POST'])
 @require_auth
+@mcp_route('trigger_execute')
 def execute_trigger(trigger_id):
     """Execute a trigger manually"""
-    try:
-        data = request.get_json() or {}
-        result = mcp_server.execute_tool('trigger_execute', {
-            'trigger_id': trigger_id,
-            'test_data': data.get('test_data', {})
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    data = request.get_json() or {}
+    return {
+        'trigger_id': trigger_id,
+        'test_data': data.get('test_data', {})
+    }
 
 
 @app.route('/api/triggers/<int:trigger_id>/logs', methods=['GET'])
 @require_auth
+@mcp_route('trigger_get_logs')
 def get_trigger_logs(trigger_id):
     """Get trigger execution logs"""
-    try:
-        result = mcp_server.execute_tool('trigger_get_logs', {
-            'trigger_id': trigger_id,
-            'limit': request.args.get('limit', 50, type=int)
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'trigger_id': trigger_id,
+        'limit': request.args.get('limit', 50, type=int)
+    }
 
 
 # ============================================================================
@@ -1101,44 +1288,31 @@ def get_trigger_logs(trigger_id):
 
 @app.route('/api/conversations/log', methods=['POST'])
 @require_auth
+@mcp_route('conversation_log', body=True)
 def log_conversation():
     """Log a conversation exchange"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('conversation_log', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/conversations/search', methods=['GET'])
 @require_auth
+@mcp_route('conversation_get_history')
 def search_conversations():
     """Search conversations"""
-    try:
-        result = mcp_server.execute_tool('conversation_get_history', {
-            'query': request.args.get('query'),
-            'user_id': request.args.get('user_id'),
-            'from_date': request.args.get('from_date'),
-            'to_date': request.args.get('to_date'),
-            'limit': request.args.get('limit', 50, type=int)
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'query': request.args.get('query'),
+        'user_id': request.args.get('user_id'),
+        'from_date': request.args.get('from_date'),
+        'to_date': request.args.get('to_date'),
+        'limit': request.args.get('limit', 50, type=int)
+    }
 
 
 @app.route('/api/conversations/<session_id>/summarize', methods=['POST'])
 @require_auth
+@mcp_route('conversation_summarize', body=True)
 def summarize_conversation(session_id):
     """Summarize a conversation"""
-    try:
-        data = request.get_json()
-        data['session_id'] = session_id
-        result = mcp_server.execute_tool('conversation_summarize', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'session_id': session_id}
 
 
 # ============================================================================
@@ -1147,45 +1321,34 @@ def summarize_conversation(session_id):
 
 @app.route('/api/context/relevant', methods=['GET'])
 @require_auth
+@mcp_route('context_get_relevant')
 def get_relevant_context():
     """Get relevant context for a topic"""
-    try:
-        result = mcp_server.execute_tool('context_get_relevant', {
-            'topic': request.args.get('topic'),
-            'include_memories': request.args.get('include_memories', 'true').lower() == 'true',
-            'include_notes': request.args.get('include_notes', 'true').lower() == 'true',
-            'include_instructions': request.args.get('include_instructions', 'true').lower() == 'true',
-            'include_conversations': request.args.get('include_conversations', 'true').lower() == 'true',
-            'limit_per_type': request.args.get('limit_per_type', 10, type=int)
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'topic': request.args.get('topic'),
+        'include_memories': request.args.get('include_memories', 'true').lower() == 'true',
+        'include_notes': request.args.get('include_notes', 'true').lower() == 'true',
+        'include_instructions': request.args.get('include_instructions', 'true').lower() == 'true',
+        'include_conversations': request.args.get('include_conversations', 'true').lower() == 'true',
+        'limit_per_type': request.args.get('limit_per_type', 10, type=int)
+    }
 
 
 @app.route('/api/context/session', methods=['POST'])
 @require_auth
+@mcp_route('context_save_session', body=True)
 def save_session_context():
     """Save session context"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('context_save_session', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/context/session/<session_name>', methods=['GET'])
 @require_auth
+@mcp_route('context_restore_session')
 def restore_session_context(session_name):
     """Restore session context"""
-    try:
-        result = mcp_server.execute_tool('context_restore_session', {
-            'session_name': session_name
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'session_name': session_name
+    }
 
 
 # ============================================================================
@@ -1194,40 +1357,31 @@ def restore_session_context(session_name):
 
 @app.route('/api/projects/from-description', methods=['POST'])
 @require_auth
+@response_cache.invalidates('projects')
+@mcp_route('project_create_from_description', body=True)
 def create_project_from_description():
     """Create project from description"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('project_create_from_description', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/projects/<int:project_id>/overview', methods=['GET'])
 @require_auth
+@mcp_route('project_get_overview')
 def get_project_overview(project_id):
     """Get complete project overview"""
-    try:
-        result = mcp_server.execute_tool('project_get_overview', {'project_id': project_id}, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {'project_id': project_id}
 
 
 @app.route('/api/projects/from-instruction/<int:instruction_id>', methods=['POST'])
 @require_auth
+@response_cache.invalidates('projects')
+@mcp_route('project_add_from_instruction')
 def create_project_from_instruction(instruction_id):
     """Create project from instruction"""
-    try:
-        data = request.get_json() or {}
-        result = mcp_server.execute_tool('project_add_from_instruction', {
-            'instruction_id': instruction_id,
-            'name': data.get('name')
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    data = request.get_json() or {}
+    return {
+        'instruction_id': instruction_id,
+        'name': data.get('name')
+    }
 
 
 # ============================================================================
@@ -1236,27 +1390,20 @@ def create_project_from_instruction(instruction_id):
 
 @app.route('/api/instructions/extract', methods=['POST'])
 @require_auth
+@response_cache.invalidates('instructions')
+@mcp_route('instruction_extract_from_text', body=True)
 def extract_instructions():
     """Extract instructions from text"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('instruction_extract_from_text', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/instructions/suggest/<session_id>', methods=['GET'])
 @require_auth
+@mcp_route('instruction_suggest_from_conversation')
 def suggest_instructions(session_id):
     """Suggest instructions from conversation"""
-    try:
-        result = mcp_server.execute_tool('instruction_suggest_from_conversation', {
-            'session_id': session_id
-        }, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return {
+        'session_id': session_id
+    }
 
 
 # ============================================================================
@@ -1265,26 +1412,16 @@ def suggest_instructions(session_id):
 
 @app.route('/api/batch/tasks', methods=['POST'])
 @require_auth
+@mcp_route('batch_create_tasks', body=True)
 def batch_create_tasks():
     """Create multiple tasks"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('batch_create_tasks', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/batch/notes', methods=['POST'])
 @require_auth
+@mcp_route('batch_create_notes', body=True)
 def batch_create_notes():
     """Create multiple notes"""
-    try:
-        data = request.get_json()
-        result = mcp_server.execute_tool('batch_create_notes', data, user=request.user)
-        return jsonify(result.get('result', result)), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 
 # ============================================================================
@@ -1294,11 +1431,11 @@ def batch_create_notes():
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return ojson({
         'status': 'healthy',
         'service': 'centre-ai-mcp-server',
         'version': '2.0.0'
-    }), 200
+    }, 200)
 
 
 # ============================================================================
@@ -1307,13 +1444,13 @@ def health_check():
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({'error': 'Not found'}), 404
+    return ojson({'error': 'Not found'}, 404)
 
 
 @app.errorhandler(500)
 def internal_error(error):
     logger.error(f"Internal error: {str(error)}")
-    return jsonify({'error': 'Internal server error'}), 500
+    return ojson({'error': 'Internal server error'}, 500)
 
 
 # ============================================================================
@@ -1329,4 +1466,16 @@ if __name__ == '__main__':
     logger.info(f"Debug mode: {debug}")
     logger.info("Features: Git, Code Indexing, Profiles, Conversations, Memories")
 
-    app.run(host=host, port=port, debug=debug)
+    if debug or not shutil.which('gunicorn'):
+        if not debug:
+            logger.warning("gunicorn not found; falling back to the Flask development server")
+        app.run(host=host, port=port, debug=debug)
+    else:
+        # app.run is a single-process development server; serve through
+        # gunicorn's worker processes outside development
+        workers = os.getenv('GUNICORN_WORKERS', str(os.cpu_count() or 1))
+        threads = os.getenv('GUNICORN_THREADS', '8')
+        os.execvp('gunicorn', [
+            'gunicorn', '-k', 'gthread', '-w', workers, '--threads', threads,
+            '--timeout', '120', '-b', f'{host}:{port}', 'app:app'
+        ])
@@ -3,6 +3,7 @@
 
 -- Create extensions
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
 -- ========================================
 -- ADMINISTRATORS
@@ -319,6 +320,8 @@ CREATE INDEX IF NOT EXISTS idx_conversations_session ON conversations(session_id
 CREATE INDEX IF NOT EXISTS idx_messages_conversation ON messages(conversation_id);
 CREATE INDEX IF NOT EXISTS idx_knowledge_edges_source ON knowledge_edges(source_id);
 CREATE INDEX IF NOT EXISTS idx_knowledge_edges_target ON knowledge_edges(target_id);
+CREATE INDEX IF NOT EXISTS idx_knowledge_nodes_type_title ON knowledge_nodes(node_type, title);
+CREATE INDEX IF NOT EXISTS idx_knowledge_nodes_trgm ON knowledge_nodes USING GIN(title gin_trgm_ops, content gin_trgm_ops);
 CREATE INDEX IF NOT EXISTS idx_knowledge_nodes_type ON knowledge_nodes(node_type);
 CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id);
 CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
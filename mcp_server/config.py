@@ -16,6 +16,12 @@ class DatabaseConfig:
     database: str = "centre_ai"
     user: str = "centre_ai"
     password: str = "centre_ai_password"
+    pool_min_size: int = 10
+    pool_max_size: int = 50
+    pool_max_inactive_lifetime: float = 300.0
+    statement_cache_size: int = 1024
+    acquire_timeout: float = 2.0
+    command_timeout: float = 60.0
 
     @property
     def connection_string(self) -> str:
@@ -56,6 +62,8 @@ class SecurityConfig:
     mcp_auth_token: str = field(default_factory=lambda: os.getenv("MCP_AUTH_TOKEN", secrets.token_hex(32)))
     admin_username: str = "admin"
     admin_password: str = "changeme"
+    admin_password_hash: Optional[str] = None
+    session_cookie_secure: bool = False
     jwt_expiry_hours: int = 24
     claude_oauth_client_id: str = field(default_factory=lambda: os.getenv("CLAUDE_OAUTH_CLIENT_ID", "claude_centre_ai"))
     claude_oauth_client_secret: str = field(default_factory=lambda: os.getenv("CLAUDE_OAUTH_CLIENT_SECRET", secrets.token_hex(32)))
@@ -83,6 +91,7 @@ class ServerConfig:
     mcp_domain: str = "localhost"
     admin_domain: str = "localhost"
     https_domains: list = field(default_factory=list)
+    public_host: Optional[str] = None
 
 
 @dataclass
@@ -108,6 +117,20 @@ class Config:
         config.database.database = os.getenv("POSTGRES_DB", config.database.database)
         config.database.user = os.getenv("POSTGRES_USER", config.database.user)
         config.database.password = os.getenv("POSTGRES_PASSWORD", config.database.password)
+        config.database.pool_min_size = int(os.getenv("POSTGRES_POOL_MIN_SIZE", config.database.pool_min_size))
+        config.database.pool_max_size = int(os.getenv("POSTGRES_POOL_MAX_SIZE", config.database.pool_max_size))
+        config.database.pool_max_inactive_lifetime = float(os.getenv(
+            "POSTGRES_POOL_MAX_INACTIVE_LIFETIME", config.database.pool_max_inactive_lifetime
+        ))
+        config.database.statement_cache_size = int(os.getenv(
+            "POSTGRES_STATEMENT_CACHE_SIZE", config.database.statement_cache_size
+        ))
+        config.database.acquire_timeout = float(os.getenv(
+            "POSTGRES_ACQUIRE_TIMEOUT", config.database.acquire_timeout
+        ))
+        config.database.command_timeout = float(os.getenv(
+            "POSTGRES_COMMAND_TIMEOUT", config.database.command_timeout
+        ))
 
         # Qdrant
         config.qdrant.host = os.getenv("QDRANT_HOST", config.qdrant.host)
@@ -124,6 +147,8 @@ class Config:
         config.security.mcp_auth_token = os.getenv("MCP_AUTH_TOKEN", config.security.mcp_auth_token)
         config.security.admin_username = os.getenv("ADMIN_USERNAME", config.security.admin_username)
         config.security.admin_password = os.getenv("ADMIN_PASSWORD", config.security.admin_password)
+        config.security.admin_password_hash = os.getenv("ADMIN_PASSWORD_HASH") or None
+        config.security.session_cookie_secure = os.getenv("SESSION_COOKIE_SECURE", "false").lower() == "true"
 
         # Server
         config.server.mcp_port = int(os.getenv("MCP_PORT", config.server.mcp_port))
@@ -137,6 +162,7 @@ class Config:
         config.server.admin_domain = os.getenv("ADMIN_DOMAIN", config.server.admin_domain)
         https_domains = os.getenv("HTTPS_DOMAINS", "")
         config.server.https_domains = [d.strip() for d in https_domains.split(",") if d.strip()]
+        config.server.public_host = os.getenv("PUBLIC_HOST") or None
 
         # Paths
         config.data_dir = Path(os.getenv("DATA_DIR", config.data_dir))
@@ -5,10 +5,10 @@ import asyncio
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from contextlib import asynccontextmanager
-import json
 import hashlib
 
 import asyncpg
+import orjson
 from qdrant_client import QdrantClient
 from qdrant_client.http import models as qdrant_models
 from sentence_transformers import SentenceTransformer
@@ -20,12 +20,37 @@ import sys
 from .config import config
 
 
+class PoolTimeoutError(Exception):
+    """No pooled connection became available within the acquire timeout"""
+
+
+class PreparedConnection(asyncpg.Connection):
+    """Connection that keeps the named statements prepared for it"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: Dict[str, asyncpg.prepared_stmt.PreparedStatement] = {}
+
+
 class Database:
     """PostgreSQL database manager"""
 
     def __init__(self):
         self.pool: Optional[asyncpg.Pool] = None
         self._lock = asyncio.Lock()
+        # Named hot statements, prepared on every new pool connection
+        self.statements: Dict[str, str] = {}
+
+    def register_statements(self, statements: Dict[str, str]):
+        """Register named SQL statements to prepare per connection"""
+        self.statements.update(statements)
+
+    async def statement(self, conn, name: str):
+        """Return the prepared statement `name` for this connection"""
+        stmt = conn.prepared.get(name)
+        if stmt is None:
+            stmt = conn.prepared[name] = await conn.prepare(self.statements[name])
+        return stmt
 
     async def connect(self):
         """Create connection pool"""
@@ -33,11 +58,42 @@ class Database:
             if self.pool is None:
                 self.pool = await asyncpg.create_pool(
                     config.database.connection_string,
-                    min_size=2,
-                    max_size=10
+                    min_size=config.database.pool_min_size,
+                    max_size=config.database.pool_max_size,
+                    max_inactive_connection_lifetime=config.database.pool_max_inactive_lifetime,
+                    statement_cache_size=config.database.statement_cache_size,
+                    command_timeout=config.database.command_timeout,
+                    connection_class=PreparedConnection,
+                    init=self._init_connection
                 )
                 await self._init_schema()
 
+    @staticmethod
+    def _encode_jsonb(value: Any) -> str:
+        """Serialize JSONB parameters; pre-encoded strings pass through unchanged"""
+        if isinstance(value, str):
+            return value
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    async def _init_connection(self, conn: asyncpg.Connection):
+        """Per-connection setup run once when the pool opens a connection"""
+        # Let callers bind dicts/lists to JSONB directly. Decoding keeps
+        # returning text so existing json.loads() call sites are unaffected.
+        await conn.set_type_codec(
+            'jsonb',
+            encoder=self._encode_jsonb,
+            decoder=lambda value: value,
+            schema='pg_catalog',
+            format='text'
+        )
+        for name, sql in self.statements.items():
+            try:
+                conn.prepared[name] = await conn.prepare(sql)
+            except asyncpg.UndefinedTableError:
+                # Fresh database: the schema is created after the pool opens,
+                # so these are prepared on first use instead
+                pass
+
     async def _init_schema(self):
         """Initialize database schema"""
         async with self.pool.acquire() as conn:
@@ -255,6 +311,24 @@ class Database:
                 CREATE INDEX IF NOT EXISTS idx_messages_conversation ON messages(conversation_id);
                 CREATE INDEX IF NOT EXISTS idx_knowledge_edges_source ON knowledge_edges(source_id);
                 CREATE INDEX IF NOT EXISTS idx_knowledge_edges_target ON knowledge_edges(target_id);
+                CREATE INDEX IF NOT EXISTS idx_knowledge_nodes_type_title ON knowledge_nodes(node_type, title);
+
+                -- Trigram index for the tag ILIKE matching in knowledge graph sync
+                -- (skipped when the role may not create the extension)
+                DO $$
+                BEGIN
+                    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                EXCEPTION WHEN insufficient_privilege THEN
+                    RAISE NOTICE 'pg_trgm unavailable, skipping trigram index';
+                END $$;
+                DO $$
+                BEGIN
+                    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN
+                        CREATE INDEX IF NOT EXISTS idx_knowledge_nodes_trgm ON knowledge_nodes
+                            USING GIN (title gin_trgm_ops, content gin_trgm_ops);
+                    END IF;
+                END $$;
+
                 CREATE INDEX IF NOT EXISTS idx_system_settings_key ON system_settings(setting_key);
 
                 -- Insert default settings
@@ -267,10 +341,34 @@ class Database:
             """)
 
     @asynccontextmanager
-    async def acquire(self):
-        """Acquire a connection from the pool"""
-        async with self.pool.acquire() as conn:
+    async def acquire(self, timeout: Optional[float] = None):
+        """Acquire a connection from the pool, failing fast when it is exhausted"""
+        try:
+            conn = await self.pool.acquire(timeout=timeout or config.database.acquire_timeout)
+        except asyncio.TimeoutError:
+            raise PoolTimeoutError("Timed out waiting for a database connection") from None
+        try:
             yield conn
+        finally:
+            await self.pool.release(conn)
+
+    # Single-statement helpers: acquire, run one query, release
+
+    async def fetch(self, query: str, *args) -> List[asyncpg.Record]:
+        async with self.acquire() as conn:
+            return await conn.fetch(query, *args)
+
+    async def fetchrow(self, query: str, *args) -> Optional[asyncpg.Record]:
+        async with self.acquire() as conn:
+            return await conn.fetchrow(query, *args)
+
+    async def fetchval(self, query: str, *args) -> Any:
+        async with self.acquire() as conn:
+            return await conn.fetchval(query, *args)
+
+    async def execute(self, query: str, *args) -> str:
+        async with self.acquire() as conn:
+            return await conn.execute(query, *args)
 
     async def close(self):
         """Close the connection pool"""
@@ -359,6 +457,12 @@ class VectorStore:
         # Use traditional SentenceTransformers
         return self.encoder.encode(text).tolist()
 
+    def encode_many(self, texts: List[str]) -> List[List[float]]:
+        """Encode several texts in one model call"""
+        if self.use_ollama and self.ollama_service:
+            return [self.encode(text) for text in texts]
+        return self.encoder.encode(texts).tolist()
+
     def generate_id(self, text: str) -> str:
         """Generate unique ID from text"""
         return hashlib.md5(text.encode()).hexdigest()
@@ -381,6 +485,22 @@ class VectorStore:
             )
         )
 
+    async def upsert_many(self, collection: str, points: List[tuple]):
+        """Insert or update several (id, vector, payload) points in one request"""
+        if not points:
+            return
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(
+            None,
+            lambda: self.client.upsert(
+                collection_name=collection,
+                points=[
+                    qdrant_models.PointStruct(id=id, vector=vector, payload=payload)
+                    for id, vector, payload in points
+                ]
+            )
+        )
+
     async def search(self, collection: str, query: str, limit: int = 10, filters: Optional[Dict] = None) -> List[Dict]:
         """Search for similar vectors"""
         query_vector = self.encode(query)
@@ -443,6 +563,19 @@ class VectorStore:
             )
         )
 
+    async def delete_many(self, collection: str, ids: List[str]):
+        """Delete several vectors in one request"""
+        if not ids:
+            return
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(
+            None,
+            lambda: self.client.delete(
+                collection_name=collection,
+                points_selector=qdrant_models.PointIdsList(points=ids)
+            )
+        )
+
     async def get_stats(self) -> Dict[str, Any]:
         """Get collection statistics"""
         stats = {}
@@ -256,6 +256,12 @@ Total memories found: {memories.get('count', 0)}
             )
 
 
+def check_mcp_token(token: str) -> bool:
+    """Constant-time comparison against the static MCP auth token"""
+    # Compare bytes: compare_digest rejects non-ASCII str arguments
+    return hmac.compare_digest(token.encode(), config.security.mcp_auth_token.encode())
+
+
 async def verify_auth_token(request: Request) -> bool:
     """
     Verify authentication token
@@ -269,7 +275,7 @@ async def verify_auth_token(request: Request) -> bool:
         token = auth_header[7:]
 
         # Try static MCP auth token first (backward compatibility)
-        if hmac.compare_digest(token, config.security.mcp_auth_token):
+        if check_mcp_token(token):
             return True
 
         # Try OAuth access token
@@ -281,7 +287,7 @@ async def verify_auth_token(request: Request) -> bool:
 
     # Also check query parameter for SSE connections (static token only)
     token = request.query_params.get("token", "")
-    if hmac.compare_digest(token, config.security.mcp_auth_token):
+    if token and check_mcp_token(token):
         return True
 
     return False
@@ -27,6 +27,7 @@ class MCPTools:
     # CRITICAL: Response size limits to prevent context overflow
     MAX_RESPONSE_SIZE = 50000  # 50k characters max per response
     MAX_MEMORY_CONTENT_SIZE = 4000  # 4k characters for memory content
+    CODE_EMBED_BATCH_SIZE = 64  # code chunks per embedding/upsert batch
 
     @staticmethod
     def _limit_response_size(content: str, max_size: int = None) -> dict:
@@ -409,6 +410,33 @@ class MCPTools:
         total_files = len(all_files)
         print(f"[Codebase Indexing] Found {total_files} files to index")
 
+        # Chunks are embedded and upserted in batches rather than one by one.
+        # A batch spans several files; if it fails, every file with chunks in
+        # it is taken back out of the counts and reported as failed.
+        pending = []
+        failed_files = set()
+        loop = asyncio.get_event_loop()
+
+        async def flush_chunks():
+            nonlocal files_indexed, chunks_indexed
+            batch = pending[:]
+            pending.clear()
+            try:
+                texts = [payload["content"] for _, payload in batch]
+                vectors = await loop.run_in_executor(None, vector_store.encode_many, texts)
+                await vector_store.upsert_many(
+                    VectorStore.COLLECTION_CODE,
+                    [(embedding_id, vector, payload)
+                     for (embedding_id, payload), vector in zip(batch, vectors)]
+                )
+            except Exception as e:
+                chunks_indexed -= len(batch)
+                for file_path in dict.fromkeys(payload["file_path"] for _, payload in batch):
+                    if file_path not in failed_files:
+                        failed_files.add(file_path)
+                        files_indexed -= 1
+                        errors.append(f"{file_path}: embedding failed: {str(e)}")
+
         for idx, (file_path, relative_path) in enumerate(all_files, 1):
             try:
                 content = file_path.read_text(encoding='utf-8', errors='ignore')
@@ -435,24 +463,15 @@ class MCPTools:
                 chunks = chunk_code(content)
 
                 for i, chunk in enumerate(chunks):
-                    # Generate embedding for chunk
-                    vector = vector_store.encode(chunk)
                     embedding_id = vector_store.generate_id(f"{codebase_id}:{relative_path}:chunk{i}")
-
-                    # Store chunk in vector database
-                    await vector_store.upsert(
-                        VectorStore.COLLECTION_CODE,
-                        embedding_id,
-                        vector,
-                        {
-                            "codebase_id": codebase_id,
-                            "file_path": relative_path,
-                            "language": language,
-                            "chunk_index": i,
-                            "total_chunks": len(chunks),
-                            "content": chunk
-                        }
-                    )
+                    pending.append((embedding_id, {
+                        "codebase_id": codebase_id,
+                        "file_path": relative_path,
+                        "language": language,
+                        "chunk_index": i,
+                        "total_chunks": len(chunks),
+                        "content": chunk
+                    }))
                     chunks_indexed += 1
 
                 files_indexed += 1
@@ -464,6 +483,12 @@ class MCPTools:
             except Exception as e:
                 errors.append(f"{relative_path}: {str(e)}")
 
+            if len(pending) >= MCPTools.CODE_EMBED_BATCH_SIZE:
+                await flush_chunks()
+
+        if pending:
+            await flush_chunks()
+
         print(f"[Codebase Indexing] Completed: {files_indexed}/{total_files} files, {chunks_indexed} chunks")
 
         # Update codebase stats
@@ -0,0 +1,130 @@
+"""
+Job Store
+Redis-backed state for background jobs, readable from any worker process
+"""
+
+import threading
+from typing import Any, Dict, Optional
+import orjson
+import redis
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Compare-and-act on the owner key so a job only touches its own lease
+RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('expire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class JobStore:
+    """
+    Keeps the latest state of each background job in Redis.
+
+    A job holds a lease (an owner key set with NX and a short expiry) that
+    its process renews while it is queued or running. Active jobs whose
+    lease has lapsed, e.g. because the worker died, are reported as failed.
+
+    Jobs claimed while Redis is unreachable are tracked in-process instead.
+    They cannot outlive their process and need no lease, but only the
+    process that runs them can report their state.
+    """
+
+    ACTIVE_STATUSES = ('queued', 'running')
+
+    def __init__(self, client: redis.Redis, prefix: str = 'job:', ttl: int = 86400, lease: int = 60):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self.lease = lease
+        self._renew = client.register_script(RENEW_SCRIPT)
+        self._release = client.register_script(RELEASE_SCRIPT)
+        self._local_owners = {}  # key -> job_id of jobs claimed without Redis
+        self._local_states = {}
+        self._local_lock = threading.Lock()
+
+    def _state_key(self, key: str) -> str:
+        return f'{self.prefix}{key}'
+
+    def _owner_key(self, key: str) -> str:
+        return f'{self.prefix}{key}:owner'
+
+    def _is_local(self, key: str, job_id: str = None) -> bool:
+        owner = self._local_owners.get(key)
+        return owner is not None and (job_id is None or owner == job_id)
+
+    def claim(self, key: str, job_id: str) -> bool:
+        """Take the lease for key; False if another live job holds it"""
+        with self._local_lock:
+            if key in self._local_owners:
+                return False
+            try:
+                claimed = bool(self.client.set(self._owner_key(key), job_id, nx=True, ex=self.lease))
+            except redis.RedisError as e:
+                logger.warning(f"Job store unavailable, tracking {key} in-process: {str(e)}")
+                self._local_owners[key] = job_id
+                return True
+            if claimed:
+                self._local_states.pop(key, None)
+            return claimed
+
+    def renew(self, key: str, job_id: str) -> bool:
+        """Extend the lease of a job; False if it no longer holds it"""
+        if self._is_local(key, job_id):
+            return True
+        try:
+            return bool(self._renew(keys=[self._owner_key(key)], args=[job_id, self.lease]))
+        except redis.RedisError as e:
+            logger.warning(f"Job lease renewal failed: {str(e)}")
+            return True
+
+    def release(self, key: str, job_id: str):
+        """Give up the lease of a finished job"""
+        with self._local_lock:
+            if self._is_local(key, job_id):
+                del self._local_owners[key]
+                return
+        try:
+            self._release(keys=[self._owner_key(key)], args=[job_id])
+        except redis.RedisError as e:
+            logger.warning(f"Job lease release failed (it expires by itself): {str(e)}")
+
+    def put(self, key: str, state: Dict[str, Any]):
+        """Store the state of a job (expires after ttl seconds)"""
+        with self._local_lock:
+            if not self._is_local(key):
+                try:
+                    self.client.setex(self._state_key(key), self.ttl, orjson.dumps(state))
+                    self._local_states.pop(key, None)
+                    return
+                except redis.RedisError as e:
+                    logger.warning(f"Job store write failed, keeping {key} in-process: {str(e)}")
+            self._local_states[key] = state
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Latest state of a job, or None if unknown"""
+        with self._local_lock:
+            local = self._local_states.get(key)
+            if local is not None and (self._is_local(key) or local.get('status') not in self.ACTIVE_STATUSES):
+                return dict(local)
+        try:
+            data, owner = self.client.mget(self._state_key(key), self._owner_key(key))
+        except redis.RedisError as e:
+            logger.warning(f"Job store unavailable: {str(e)}")
+            return dict(local) if local is not None else None
+        if not data:
+            return dict(local) if local is not None else None
+
+        state = orjson.loads(data)
+        if state.get('status') in self.ACTIVE_STATUSES and (owner or b'').decode() != state.get('job_id'):
+            state.update(status='failed', error='Job stopped responding (its worker exited)')
+        return state
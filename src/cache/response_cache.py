@@ -0,0 +1,135 @@
+"""
+Response Cache
+Redis-backed cache for idempotent GET endpoints with namespace invalidation
+"""
+
+import os
+import time
+import hashlib
+from functools import wraps
+from typing import Callable
+from flask import request, make_response, current_app
+import orjson
+import redis
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Caches JSON GET responses in Redis; writes invalidate whole namespaces.
+
+    After a connection error Redis is skipped for breaker_seconds, so an
+    unreachable cache costs nothing instead of a socket timeout per request.
+    Invalidations skipped meanwhile are replayed once Redis is back.
+    """
+
+    def __init__(self, url: str = None, prefix: str = 'respcache:', breaker_seconds: float = None):
+        self.url = url or 'redis://{host}:{port}/0'.format(
+            host=os.getenv('REDIS_HOST', 'redis'),
+            port=os.getenv('REDIS_PORT', '6379')
+        )
+        self.prefix = prefix
+        self.client = redis.Redis.from_url(
+            self.url,
+            password=os.getenv('REDIS_PASSWORD') or None,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5
+        )
+        self.breaker_seconds = breaker_seconds if breaker_seconds is not None else float(
+            os.getenv('RESPONSE_CACHE_BREAKER_SECONDS', 10)
+        )
+        self._skip_until = 0.0
+        self._missed_invalidations = set()
+
+    def _available(self) -> bool:
+        """False while the breaker is open; replays missed invalidations when it closes"""
+        if time.monotonic() < self._skip_until:
+            return False
+        if self._missed_invalidations:
+            missed, self._missed_invalidations = self._missed_invalidations, set()
+            self.invalidate(*missed)
+            return time.monotonic() >= self._skip_until
+        return True
+
+    def _failed(self, action: str, error: redis.RedisError):
+        """Log a Redis error and open the breaker if Redis is unreachable"""
+        if isinstance(error, (redis.ConnectionError, redis.TimeoutError)):
+            self._skip_until = time.monotonic() + self.breaker_seconds
+            logger.warning(f"Response cache {action} failed, skipping Redis for {self.breaker_seconds:g}s: {str(error)}")
+        else:
+            logger.warning(f"Response cache {action} failed: {str(error)}")
+
+    def _key(self, namespace: str) -> str:
+        """Cache key for the current request: route, user and sorted query params"""
+        params = '&'.join(f'{k}={v}' for k, v in sorted(request.args.items(multi=True)))
+        digest = hashlib.blake2b(f'{request.path}?{params}'.encode(), digest_size=16).hexdigest()
+        user = getattr(request, 'user', None)
+        return f'{self.prefix}{namespace}:user={user}:{digest}'
+
+    @staticmethod
+    def _cacheable(response) -> bool:
+        """Only successful results are cached; tools report failures as 200 + success: false"""
+        if response.status_code != 200 or response.mimetype != 'application/json':
+            return False
+        try:
+            body = orjson.loads(response.get_data())
+        except orjson.JSONDecodeError:
+            return False
+        return not (isinstance(body, dict) and body.get('success') is False)
+
+    def cached_get(self, namespace: str, ttl: int = 30) -> Callable:
+        """Decorator serving a GET handler's 200 responses from Redis for ttl seconds"""
+        def decorator(f):
+            @wraps(f)
+            def decorated_function(*args, **kwargs):
+                if not self._available():
+                    return f(*args, **kwargs)
+                key = self._key(namespace)
+                try:
+                    body = self.client.get(key)
+                except redis.RedisError as e:
+                    self._failed('read', e)
+                    return f(*args, **kwargs)
+                if body is not None:
+                    return current_app.response_class(body, status=200, mimetype='application/json')
+
+                response = make_response(f(*args, **kwargs))
+                if self._cacheable(response) and self._available():
+                    try:
+                        self.client.setex(key, ttl, response.get_data())
+                    except redis.RedisError as e:
+                        self._failed('write', e)
+                return response
+            return decorated_function
+        return decorator
+
+    def invalidates(self, *namespaces: str) -> Callable:
+        """Decorator dropping cached responses of namespaces after a successful write"""
+        def decorator(f):
+            @wraps(f)
+            def decorated_function(*args, **kwargs):
+                response = make_response(f(*args, **kwargs))
+                if response.status_code < 400:
+                    self.invalidate(*namespaces)
+                return response
+            return decorated_function
+        return decorator
+
+    def invalidate(self, *namespaces: str):
+        """Delete every cached response in the given namespaces"""
+        if not namespaces:
+            return
+        if not self._available():
+            self._missed_invalidations.update(namespaces)
+            return
+        for i, namespace in enumerate(namespaces):
+            try:
+                keys = list(self.client.scan_iter(match=f'{self.prefix}{namespace}:*', count=500))
+                if keys:
+                    self.client.delete(*keys)
+            except redis.RedisError as e:
+                self._failed('invalidation', e)
+                self._missed_invalidations.update(namespaces[i:])
+                return
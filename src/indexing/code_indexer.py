@@ -5,7 +5,11 @@ Indexes code repositories for semantic search
 
 import os
 import hashlib
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
 from pathspec import PathSpec
 from pathspec.patterns import GitWildMatchPattern
 import logging
@@ -13,6 +17,62 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class SemanticCache:
+    """
+    Reuses search results for queries whose embeddings are near-identical.
+
+    The cache is per process: invalidate() only clears the worker that ran
+    the index job, so other workers may serve pre-index results until their
+    entries expire. The TTL is kept short to bound that window.
+    """
+
+    def __init__(self, threshold: float = 0.97, max_entries: int = 256, ttl: float = 60.0):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = []  # (expires_at, key, unit vector, results)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _unit(vector: List[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def get(self, key: Tuple, vector: List[float]) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for a query with the same key and a similar embedding"""
+        unit = self._unit(vector)
+        now = time.monotonic()
+        with self._lock:
+            self._entries = [e for e in self._entries if e[0] > now]
+            best, best_score = None, self.threshold
+            for _, entry_key, entry_vector, results in self._entries:
+                if entry_key != key:
+                    continue
+                score = float(np.dot(unit, entry_vector))
+                if score >= best_score:
+                    best, best_score = results, score
+        # Callers get their own list so mutating it cannot change the cached copy
+        return list(best) if best is not None else None
+
+    def put(self, key: Tuple, vector: List[float], results: List[Dict[str, Any]]):
+        """Store results for a query embedding"""
+        entry = (time.monotonic() + self.ttl, key, self._unit(vector), list(results))
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries.pop(0)
+            self._entries.append(entry)
+
+    def invalidate(self, repo_id: Optional[str] = None):
+        """Drop entries that may include results from repo_id (all entries if None)"""
+        with self._lock:
+            if repo_id is None:
+                self._entries = []
+            else:
+                # Keys start with repo_id; unscoped (None) searches span every repo
+                self._entries = [e for e in self._entries if e[1][0] not in (repo_id, None)]
+
+
 class CodeIndexer:
     """Indexes code files from Git repositories"""
 
@@ -85,8 +145,13 @@ class CodeIndexer:
         '.DS_Store'
     ]
 
+    # File reads are I/O bound; chunks are embedded across files in batches
+    SCAN_WORKERS = 8
+    EMBED_BATCH_SIZE = 64
+
     def __init__(self, vector_db=None):
         self.vector_db = vector_db
+        self.search_cache = SemanticCache()
         self.ignore_spec = PathSpec.from_lines(
             GitWildMatchPattern,
             self.DEFAULT_IGNORE_PATTERNS
@@ -127,11 +192,34 @@ class CodeIndexer:
 
         return chunks
 
+    def _read_file(self, candidate: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+        """Read one code file and build its metadata (None if unreadable or empty)"""
+        file_path, relative_path, language = candidate
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        except Exception as e:
+            logger.debug(f"Skipping file {relative_path}: {str(e)}")
+            return None
+
+        # Skip empty files
+        if not content.strip():
+            return None
+
+        return {
+            'file_path': relative_path,
+            'language': language,
+            'content': content,
+            'file_hash': self._hash_content(content),
+            'lines_count': len(content.split('\n')),
+            'size_bytes': len(content.encode('utf-8'))
+        }
+
     def scan_repository(self, repo_path: str) -> List[Dict[str, Any]]:
         """
         Scan repository and return list of code files with metadata
         """
-        files = []
+        candidates = []
 
         for root, dirs, filenames in os.walk(repo_path):
             # Filter directories
@@ -150,29 +238,10 @@ class CodeIndexer:
                 if not language:
                     continue
 
-                # Try to read file
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-
-                    # Skip empty files
-                    if not content.strip():
-                        continue
-
-                    file_info = {
-                        'file_path': relative_path,
-                        'language': language,
-                        'content': content,
-                        'file_hash': self._hash_content(content),
-                        'lines_count': len(content.split('\n')),
-                        'size_bytes': len(content.encode('utf-8'))
-                    }
+                candidates.append((file_path, relative_path, language))
 
-                    files.append(file_info)
-
-                except Exception as e:
-                    logger.debug(f"Skipping file {relative_path}: {str(e)}")
-                    continue
+        with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as executor:
+            files = [f for f in executor.map(self._read_file, candidates) if f is not None]
 
         logger.info(f"Scanned repository: found {len(files)} code files")
         return files
@@ -253,15 +322,50 @@ class CodeIndexer:
                     'message': 'No code files found to index'
                 }
 
-            # Index each file
-            indexed_count = 0
-            failed_count = 0
+            # Embed chunks in batches spanning files; one model call per batch
+            failed_files = set()
+            pending = []
+
+            def flush():
+                batch_files = {item[0]['file_path'] for item in pending}
+                try:
+                    vectors = self.vector_db.embed_texts([item[2] for item in pending])
+                    points = [
+                        {
+                            'id': f"{repo_id}:{file_info['file_path']}:chunk{i}",
+                            'vector': vector,
+                            'payload': {
+                                'repo_id': repo_id,
+                                'file_path': file_info['file_path'],
+                                'language': file_info['language'],
+                                'chunk_index': i,
+                                'total_chunks': total,
+                                'content': chunk,
+                                'file_hash': file_info['file_hash']
+                            }
+                        }
+                        for (file_info, i, chunk, total), vector in zip(pending, vectors)
+                    ]
+                    if not self.vector_db.upsert_points(collection_name, points):
+                        failed_files.update(batch_files)
+                except Exception as e:
+                    logger.error(f"Error indexing batch of {len(pending)} chunks: {str(e)}")
+                    failed_files.update(batch_files)
+                pending.clear()
 
             for file_info in files:
-                if self.index_file(repo_id, file_info, collection_name):
-                    indexed_count += 1
-                else:
-                    failed_count += 1
+                chunks = self._chunk_code(file_info['content'])
+                for i, chunk in enumerate(chunks):
+                    pending.append((file_info, i, chunk, len(chunks)))
+                    if len(pending) >= self.EMBED_BATCH_SIZE:
+                        flush()
+            if pending:
+                flush()
+
+            failed_count = len(failed_files)
+            indexed_count = len(files) - failed_count
+
+            self.search_cache.invalidate(repo_id)
 
             return {
                 'success': True,
@@ -284,9 +388,10 @@ class CodeIndexer:
         repo_id: Optional[str] = None,
         language: Optional[str] = None,
         limit: int = 10,
-        collection_name: str = 'code_files'
+        collection_name: str = 'code_files',
+        use_cache: bool = True
     ) -> List[Dict[str, Any]]:
-        """Search code semantically"""
+        """Search code semantically (near-duplicate queries are served from cache)"""
         if not self.vector_db:
             logger.error("Vector DB not initialized")
             return []
@@ -299,14 +404,23 @@ class CodeIndexer:
             if language:
                 filter_conditions['language'] = language
 
+            query_vector = self.vector_db.embed_query(query)
+            cache_key = (repo_id or None, language, limit, collection_name)
+            if use_cache:
+                cached = self.search_cache.get(cache_key, query_vector)
+                if cached is not None:
+                    return cached
+
             # Search
-            results = self.vector_db.search_text(
+            results = self.vector_db.search(
                 collection_name=collection_name,
-                query_text=query,
+                query_vector=query_vector,
                 limit=limit,
                 filter_conditions=filter_conditions if filter_conditions else None
             )
 
+            if use_cache:
+                self.search_cache.put(cache_key, query_vector, results)
             return results
 
         except Exception as e:
@@ -322,5 +436,6 @@ class CodeIndexer:
         # Note: Qdrant doesn't support delete by filter in community edition
         # This would require iterating through all points and deleting individually
         # For now, we'll return a placeholder
+        self.search_cache.invalidate(repo_id)
         logger.warning(f"Repository index deletion not fully implemented for {repo_id}")
         return True
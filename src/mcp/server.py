@@ -5,7 +5,7 @@ Implements the Model Context Protocol for AI model interactions
 
 import time
 import uuid
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional
 from datetime import datetime
 import logging
 
@@ -181,6 +181,38 @@ class MCPServer:
                 'error': str(e)
             }
 
+    def iter_tool(self, tool_name: str, parameters: Dict[str, Any], user: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a tool's streaming handler, yielding result records one at a time.
+
+        The handler is called before anything is streamed, so handlers that
+        validate their input eagerly (and return a generator) raise here,
+        letting the caller answer with a proper error status.
+        """
+        self.request_count += 1
+
+        if tool_name not in self.tools_registry:
+            raise ValueError(f"Tool '{tool_name}' not found")
+
+        stream = self.tools_registry[tool_name].get('stream')
+        if not stream:
+            raise ValueError(f"Tool '{tool_name}' has no streaming handler")
+
+        return self._run_stream(tool_name, stream(parameters), user)
+
+    def _run_stream(self, tool_name: str, records: Iterator[Dict[str, Any]], user: str) -> Iterator[Dict[str, Any]]:
+        """Drive a streaming handler, turning failures into a final error record"""
+        start_time = time.time()
+        try:
+            yield from records
+        except Exception as e:
+            logger.error(f"Error streaming tool '{tool_name}': {str(e)}")
+            yield {'type': 'error', 'error': str(e)}
+            return
+
+        self.execution_count += 1
+        logger.info(f"Tool '{tool_name}' streamed in {time.time() - start_time:.3f}s by {user}")
+
     def get_request_count(self) -> int:
         """Get total request count"""
         return self.request_count
@@ -6,7 +6,7 @@ Tools for managing artifacts, instructions, memories, and projects through AI
 import os
 import psycopg2
 from psycopg2.extras import RealDictCursor
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional
 from datetime import datetime
 import logging
 import json
@@ -344,7 +344,8 @@ class AITools:
                     'depth': {'type': 'integer', 'required': False, 'description': 'Traversal depth', 'default': 2},
                     'include_entities': {'type': 'boolean', 'required': False, 'description': 'Include linked entities', 'default': True}
                 },
-                'handler': self.knowledge_get_graph
+                'handler': self.knowledge_get_graph,
+                'stream': self.knowledge_iter_graph
             },
             {
                 'name': 'knowledge_delete_node',
@@ -1771,6 +1772,74 @@ class AITools:
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
+    def knowledge_iter_graph(self, params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield the knowledge graph one node/edge record at a time (streaming variant of knowledge_get_graph)"""
+        center_node_id = params.get('center_node_id')
+        depth = params.get('depth', 2)
+
+        def record(kind: str, row) -> Dict[str, Any]:
+            item = dict(row)
+            if item.get('created_at'):
+                item['created_at'] = item['created_at'].isoformat()
+            return {'type': kind, kind: item}
+
+        node_count = edge_count = 0
+        conn = get_db_connection()
+        try:
+            if center_node_id:
+                cur = conn.cursor(cursor_factory=RealDictCursor)
+                visited = set()
+                seen_edges = set()
+                to_visit = [(center_node_id, 0)]
+
+                while to_visit:
+                    current_id, current_depth = to_visit.pop(0)
+                    if current_id in visited or current_depth > depth:
+                        continue
+                    visited.add(current_id)
+
+                    cur.execute("SELECT * FROM knowledge_nodes WHERE id = %s", (current_id,))
+                    node = cur.fetchone()
+                    if not node:
+                        continue
+                    node_count += 1
+                    yield record('node', node)
+
+                    cur.execute("""
+                        SELECT * FROM knowledge_edges
+                        WHERE source_id = %s OR target_id = %s
+                    """, (current_id, current_id))
+
+                    for edge in cur.fetchall():
+                        if edge['id'] not in seen_edges:
+                            seen_edges.add(edge['id'])
+                            edge_count += 1
+                            yield record('edge', edge)
+                        next_id = edge['target_id'] if edge['source_id'] == current_id else edge['source_id']
+                        if next_id not in visited:
+                            to_visit.append((next_id, current_depth + 1))
+                cur.close()
+            else:
+                # Named (server-side) cursors keep only one batch of rows in memory
+                for kind, query in (
+                    ('node', "SELECT * FROM knowledge_nodes ORDER BY created_at DESC LIMIT 200"),
+                    ('edge', "SELECT * FROM knowledge_edges LIMIT 500"),
+                ):
+                    cur = conn.cursor(name=f'knowledge_graph_{kind}s', cursor_factory=RealDictCursor)
+                    cur.itersize = 100
+                    cur.execute(query)
+                    for row in cur:
+                        if kind == 'node':
+                            node_count += 1
+                        else:
+                            edge_count += 1
+                        yield record(kind, row)
+                    cur.close()
+        finally:
+            conn.close()
+
+        yield {'type': 'summary', 'node_count': node_count, 'edge_count': edge_count}
+
     def knowledge_delete_node(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Delete a knowledge node"""
         node_id = params.get('node_id')
@@ -5,7 +5,7 @@ Tools for managing Git repositories: clone, fetch, modify, commit
 
 import os
 import shutil
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator
 import git
 from git import Repo, GitCommandError
 import logging
@@ -88,7 +88,8 @@ class GitTools:
                     'repo_name': {'type': 'string', 'required': True, 'description': 'Repository name'},
                     'path': {'type': 'string', 'required': False, 'description': 'Subdirectory path', 'default': '.'}
                 },
-                'handler': self.git_list_files
+                'handler': self.git_list_files,
+                'stream': self.git_iter_files
             },
             {
                 'name': 'git_read_file',
@@ -202,10 +203,10 @@ class GitTools:
                     'error': f'Repository {repo_name} already exists. Use git_pull to update.'
                 }
 
-            # Build clone kwargs
+            # Build clone kwargs; shallow clones only fetch the requested branch
             clone_kwargs = {'branch': branch}
             if depth:
-                clone_kwargs['depth'] = depth
+                clone_kwargs.update(depth=depth, single_branch=True, no_tags=True)
 
             # Handle authentication
             clone_url = repo_url
@@ -223,13 +224,7 @@ class GitTools:
 
             logger.info(f"Cloning repository: {repo_url} to {repo_path}")
 
-            # Clone with authentication
-            if 'env' in clone_kwargs:
-                repo = Repo.clone_from(clone_url, repo_path, branch=branch,
-                                       depth=depth if depth else None,
-                                       env=clone_kwargs.get('env'))
-            else:
-                repo = Repo.clone_from(clone_url, repo_path, **clone_kwargs)
+            repo = Repo.clone_from(clone_url, repo_path, **clone_kwargs)
 
             return {
                 'success': True,
@@ -272,8 +267,13 @@ class GitTools:
             repo = Repo(repo_path)
             origin = repo.remotes.origin
 
-            # Pull changes
-            pull_info = origin.pull()
+            if os.path.exists(os.path.join(repo.git_dir, 'shallow')):
+                # A shallow clone has no merge base with upstream, so pulling fails
+                # once upstream moves; fetch the new tip and reset onto it instead
+                origin.fetch(repo.active_branch.name, depth=1)
+                repo.head.reset('FETCH_HEAD', index=True, working_tree=True)
+            else:
+                origin.pull()
 
             return {
                 'success': True,
@@ -423,6 +423,52 @@ class GitTools:
                 'error': str(e)
             }
 
+    def git_iter_files(self, params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Stream repository entries as they are read (unsorted variant of git_list_files).
+
+        Input is checked before streaming starts: raises FileNotFoundError for
+        an unknown repository or path and NotADirectoryError for a file path.
+        """
+        repo_name = params.get('repo_name')
+        path = params.get('path', '.')
+        repo_path = self._get_repo_path(repo_name)
+
+        if not os.path.exists(repo_path):
+            raise FileNotFoundError(f'Repository {repo_name} not found')
+
+        full_path = os.path.join(repo_path, path)
+        if not os.path.exists(full_path):
+            raise FileNotFoundError(f'Path {path} not found in repository')
+        if not os.path.isdir(full_path):
+            raise NotADirectoryError(f'Path {path} is not a directory')
+
+        return self._iter_files(repo_name, repo_path, path, full_path)
+
+    def _iter_files(self, repo_name: str, repo_path: str, path: str, full_path: str) -> Iterator[Dict[str, Any]]:
+        """Yield directory entries of full_path followed by a summary record"""
+        total_files = total_dirs = 0
+        with os.scandir(full_path) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+
+                rel_path = os.path.relpath(entry.path, repo_path)
+                if entry.is_dir():
+                    total_dirs += 1
+                    yield {'type': 'directory', 'path': rel_path}
+                else:
+                    total_files += 1
+                    yield {'type': 'file', 'path': rel_path, 'size': entry.stat().st_size}
+
+        yield {
+            'type': 'summary',
+            'repo_name': repo_name,
+            'path': path,
+            'total_files': total_files,
+            'total_dirs': total_dirs
+        }
+
     def git_list_files(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """List files in repository"""
         repo_name = params.get('repo_name')
@@ -4,6 +4,7 @@ Manages vector storage and semantic search
 """
 
 import os
+from functools import cached_property, lru_cache
 from typing import List, Dict, Any, Optional
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
@@ -30,12 +31,17 @@ class VectorDB:
         else:
             self.client = QdrantClient(url=self.host)
 
-        # Initialize embedding model
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
         self.embedding_dim = 384  # Dimension for all-MiniLM-L6-v2
+        # Search queries repeat often and the encoder is deterministic
+        self._embed_query_cached = lru_cache(maxsize=2048)(self._embed_query_tuple)
 
         logger.info(f"Vector DB initialized with host: {self.host}")
 
+    @cached_property
+    def embedding_model(self) -> SentenceTransformer:
+        """Embedding model, loaded on first encode (collection admin never needs it)"""
+        return SentenceTransformer('all-MiniLM-L6-v2')
+
     def create_collection(self, collection_name: str, vector_size: int = None) -> bool:
         """Create a new collection"""
         try:
@@ -75,6 +81,13 @@ class VectorDB:
         """Generate embedding for text"""
         return self.embedding_model.encode(text).tolist()
 
+    def _embed_query_tuple(self, text: str) -> tuple:
+        return tuple(self.embedding_model.encode(text).tolist())
+
+    def embed_query(self, text: str) -> List[float]:
+        """Generate embedding for a search query, memoized per exact string"""
+        return list(self._embed_query_cached(text))
+
     def embed_texts(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for multiple texts"""
         return self.embedding_model.encode(texts).tolist()
@@ -194,7 +207,7 @@ class VectorDB:
         filter_conditions: Dict[str, Any] = None
     ) -> List[Dict[str, Any]]:
         """Search using text query (automatically embedded)"""
-        query_vector = self.embed_text(query_text)
+        query_vector = self.embed_query(query_text)
         return self.search(
             collection_name=collection_name,
             query_vector=query_vector,
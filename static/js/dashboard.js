@@ -78,6 +78,33 @@ class APIClient {
         }
     }
 
+    async streamRecords(endpoint, onRecord) {
+        const response = await fetch(`${this.baseURL}${endpoint}`, {
+            headers: { 'X-API-Key': this.apiKey }
+        });
+
+        if (!response.ok) {
+            const data = await response.json().catch(() => ({}));
+            throw new Error(data.error || `HTTP ${response.status}`);
+        }
+
+        // NDJSON: one record per line, handled as soon as the line arrives
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        while (true) {
+            const { done, value } = await reader.read();
+            buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+            for (const line of lines) {
+                if (line.trim()) onRecord(JSON.parse(line));
+            }
+            if (done) break;
+        }
+        if (buffer.trim()) onRecord(JSON.parse(buffer));
+    }
+
     // Status & Stats
     async getStatus() { return this.request('/api/status'); }
     async getStats() { return this.request('/api/stats'); }
@@ -112,6 +139,10 @@ class APIClient {
         return this.request(`/api/git/repos/${encodeURIComponent(repoName)}/index`, { method: 'POST' });
     }
 
+    async getIndexStatus(repoName) {
+        return this.request(`/api/git/repos/${encodeURIComponent(repoName)}/index/status`);
+    }
+
     // Memories
     async listMemories(params = {}) {
         const query = new URLSearchParams();
@@ -187,7 +218,14 @@ class APIClient {
         const query = new URLSearchParams();
         if (params.node_type) query.set('node_type', params.node_type);
         if (params.limit) query.set('limit', params.limit);
-        return this.request(`/api/knowledge/graph?${query}`);
+        const graph = { nodes: [], edges: [] };
+        let error = null;
+        await this.streamRecords(`/api/knowledge/graph?${query}`, (record) => {
+            if (record.type === 'node') graph.nodes.push(record.node);
+            else if (record.type === 'edge') graph.edges.push(record.edge);
+            else if (record.type === 'error') error = record.error;
+        });
+        return error ? { success: false, error } : { success: true, graph };
     }
 
     async listKnowledgeNodes(params = {}) {
@@ -413,11 +451,16 @@ async function pullRepository(name) {
 async function indexRepository(name) {
     showToast(`Indexiere ${name}...`, 'warning');
     try {
-        const result = await api.indexRepo(name);
-        if (result.success) {
-            showToast(`${result.indexed_files} Dateien indexiert`);
+        let job = await api.indexRepo(name);
+        // Indexing runs in the background; poll until the job finishes
+        while (job.status === 'queued' || job.status === 'running') {
+            await new Promise(resolve => setTimeout(resolve, 2000));
+            job = await api.getIndexStatus(name);
+        }
+        if (job.status === 'completed') {
+            showToast(`${job.result.files_indexed} Dateien indexiert`);
         } else {
-            showToast(result.error, 'error');
+            showToast(job.error || (job.result && job.result.error) || 'Indexierung fehlgeschlagen', 'error');
         }
     } catch (error) {
         showToast(error.message, 'error');